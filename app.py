@@ -6,16 +6,19 @@ for the PLTS Editor.
 """
 
 import sys
-from typing import Dict, Set, Any
+from bisect import insort, bisect_left
+from enum import IntEnum
+from functools import partial
+from typing import Dict, Set, Any, NamedTuple
 
 # GUI Imports
 from PyQt6.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, 
-    QMenu, QMessageBox, QInputDialog, QLabel, QSplitter, QLineEdit, QComboBox, 
-    QTreeWidget, QTreeWidgetItem, QFrame, QPushButton, QListWidget, 
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTextEdit,
+    QMenu, QMessageBox, QInputDialog, QLabel, QSplitter, QLineEdit, QComboBox,
+    QTreeView, QFrame, QPushButton, QListWidget,
     QAbstractItemView
 )
-from PyQt6.QtCore import Qt, QPoint
+from PyQt6.QtCore import Qt, QPoint, QAbstractItemModel, QModelIndex, QStringListModel
 from PyQt6.QtGui import QAction
 
 # Internal Logic Imports
@@ -23,7 +26,7 @@ from math_objects.lattice import Lattice, ResiduatedLattice, TwistStructure
 from math_objects.world import World
 from math_objects.model import Model
 from json_object_handler.json_handler import JSONHandler
-from parser.formula_parser import FormulaParser 
+from parser.formula_parser import parse_formula, compile_formula
 
 # Dialog Imports
 from app_object_creation.new_lattice_dialog import NewLatticeDialog
@@ -71,6 +74,31 @@ QComboBox {
     border: 1px solid #8f8f91;
     border-radius: 3px;
 }
+
+QLabel#sectionHeader {
+    font-weight: bold;
+}
+
+QLabel#sectionHeaderSpaced {
+    font-weight: bold;
+    margin-top: 10px;
+}
+
+QLabel#resultLabel {
+    font-weight: bold;
+    font-size: 14px;
+}
+
+QLabel#validityLabel {
+    font-weight: bold;
+    font-size: 14px;
+    margin-left: 20px;
+}
+
+QPushButton#legendButton {
+    font-weight: bold;
+    color: #2980b9;
+}
 """
 
 # DARK THEME DEFINITION
@@ -168,7 +196,7 @@ QCheckBox::indicator:hover {
     border: 1px solid #2a82da;
 }
 
-QTreeWidget, QListWidget, QTableWidget {
+QTreeView, QListWidget, QTableWidget {
     background-color: #191919;
     color: #ffffff;
     border: 1px solid #555;
@@ -238,9 +266,258 @@ QScrollBar::handle:vertical {
 QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
     height: 0px;
 }
+
+QLabel#sectionHeader {
+    font-weight: bold;
+}
+
+QLabel#sectionHeaderSpaced {
+    font-weight: bold;
+    margin-top: 10px;
+}
+
+QLabel#resultLabel {
+    font-weight: bold;
+    font-size: 14px;
+}
+
+QLabel#validityLabel {
+    font-weight: bold;
+    font-size: 14px;
+    margin-left: 20px;
+}
+
+QPushButton#legendButton {
+    font-weight: bold;
+    color: #5dade2;
+}
 """
 
 
+# Shared stylesheet strings, looked up by dark-mode flag so toggling reuses
+# the same string objects instead of rebuilding them.
+_THEMES = {True: DARK_STYLESHEET, False: LIGHT_STYLESHEET}
+
+# Color roles for HTML generation, one flat dict per theme, frozen at module
+# scope so no lookup rebuilds them.
+_THEME_COLORS_LIGHT: Dict[str, str] = {
+    "header": "#2c3e50",  # Dark Blue
+    "accent": "#8e44ad",  # Purple
+    "warn":   "#d35400",  # Orange
+    "info":   "#2980b9",  # Blue
+    "error":  "#c0392b",  # Red
+    "text":   "#000000",  # Black
+    "subtle": "#7f8c8d",  # Gray
+    "tableBorder": "#ddd",
+    "tableBg":     "#f2f2f2",
+}
+_THEME_COLORS_DARK: Dict[str, str] = {
+    "header": "#aaddff",  # Light Blue
+    "accent": "#d1c4e9",  # Light Purple
+    "warn":   "#ffcc80",  # Light Orange
+    "info":   "#81d4fa",  # Cyan
+    "error":  "#ff8a80",  # Light Red
+    "text":   "#ffffff",  # White
+    "subtle": "#b0bec5",  # Light Gray
+    "tableBorder": "#555",
+    "tableBg":     "#333",
+}
+
+class Kind(IntEnum):
+    """Integer index of each object category into MainWindow._stores."""
+    LATTICE = 0
+    RESID = 1
+    TWIST = 2
+    WORLD = 3
+    MODEL = 4
+
+
+class ObjectKind(NamedTuple):
+    """Declarative descriptor for one category of persisted object."""
+    label: str          # internal UI category ("Lattice", "World", ...)
+    display: str        # user-facing name ("Lattice", "State", "PLTS")
+    json_key: str       # top-level key inside the JSON manifest
+    name_key: str       # per-entry name field inside the manifest
+    filename: str       # manifest path
+    store: Kind         # index of the in-memory store in MainWindow._stores
+    tree_category: str  # Project Explorer category label
+    loader: Any         # JSONHandler load function
+
+
+_OBJECT_KINDS = (
+    ObjectKind("Lattice", "Lattice", "lattices", "name",
+               "json_files/lattices.json", Kind.LATTICE, "Lattices",
+               JSONHandler.load_lattice_from_json),
+    ObjectKind("Residuated Lattice", "Residuated Lattice", "residuated_lattices", "name_residuated_lattice",
+               "json_files/residuated_lattices.json", Kind.RESID, "Residuated Lattices",
+               JSONHandler.load_residuated_lattice_from_json),
+    ObjectKind("Twist Structure", "Twist Structure", "twist_structures", "name",
+               "json_files/twist_structures.json", Kind.TWIST, "Twist Structures",
+               JSONHandler.load_twist_structure_from_json),
+    ObjectKind("World", "State", "worlds", "world_name",
+               "json_files/worlds.json", Kind.WORLD, "States",
+               JSONHandler.load_world_from_json),
+    ObjectKind("Model", "PLTS", "models", "model_name",
+               "json_files/models.json", Kind.MODEL, "PLTSs",
+               JSONHandler.load_model_from_json),
+)
+_KINDS_BY_LABEL = {kind.label: kind for kind in _OBJECT_KINDS}
+_KINDS_BY_TREE = {kind.tree_category: kind for kind in _OBJECT_KINDS}
+
+
+# Formula toolbar buttons: (displayed symbol, inserted text).
+_SYMBOL_MAP = [
+    ("□", "[a]"),
+    ("◇", "<a>"),
+    ("¬", "~"),
+    ("▷", "->"),
+    ("▷◁", "<->"),
+    ("∧", "&"),
+    ("∨", "|"),
+    ("⊥", "0"),
+    ("⊤", "1")
+]
+
+
+class WorkspaceModel(QAbstractItemModel):
+    """
+    Lightweight item model backing the Project Explorer tree.
+
+    The top level is a fixed list of category rows; children are plain object
+    names stored per category, so each node costs a list entry instead of a
+    full QTreeWidgetItem. Inserts and removals notify the view through
+    beginInsertRows/endInsertRows so only the affected rows are re-laid out.
+
+    During a bulk load (begin_bulk_load/end_bulk_load) new names are parked
+    in a pending list and materialized with one row-insert signal per
+    category at the end, so bulk loads do not re-layout the view per object.
+    Outside bulk loads every add/remove notifies the view immediately.
+    """
+
+    CATEGORIES = ["Lattices", "Residuated Lattices", "Twist Structures", "States", "PLTSs"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # One name list per category, indexed by category ID, plus a
+        # name -> row index per category for O(1) membership and removal.
+        self._children = [[] for _ in self.CATEGORIES]
+        self._rows = [{} for _ in self.CATEGORIES]
+        # Names parked during a bulk load, flushed by end_bulk_load.
+        self._pending = [[] for _ in self.CATEGORIES]
+        self._bulk = False
+
+    # Internal IDs encode the tree depth: 0 marks a category row,
+    # (category_id + 1) marks a child row of that category.
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, 0)
+        return self.createIndex(row, column, parent.row() + 1)
+
+    def parent(self, index: QModelIndex) -> QModelIndex:
+        if not index.isValid() or index.internalId() == 0:
+            return QModelIndex()
+        return self.createIndex(int(index.internalId()) - 1, 0, 0)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if not parent.isValid():
+            return len(self.CATEGORIES)
+        if parent.internalId() == 0:
+            return len(self._children[parent.row()])
+        return 0
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 1
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if not parent.isValid():
+            return True
+        if parent.internalId() == 0:
+            cat_id = parent.row()
+            return bool(self._children[cat_id]) or bool(self._pending[cat_id])
+        return False
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        cat_id = int(index.internalId())
+        if cat_id == 0:
+            return self.CATEGORIES[index.row()]
+        return self._children[cat_id - 1][index.row()]
+
+    # --- Mutation helpers used by MainWindow ---
+
+    def category_index(self, cat_id: int) -> QModelIndex:
+        return self.createIndex(cat_id, 0, 0)
+
+    def contains(self, cat_id: int, name: str) -> bool:
+        return name in self._rows[cat_id] or name in self._pending[cat_id]
+
+    def begin_bulk_load(self) -> None:
+        """Parks subsequent add_object calls until end_bulk_load."""
+        self._bulk = True
+
+    def end_bulk_load(self) -> None:
+        """Flushes parked names with one insert signal per category."""
+        self._bulk = False
+        for cat_id, pending in enumerate(self._pending):
+            if not pending:
+                continue
+            first = len(self._children[cat_id])
+            self.beginInsertRows(self.category_index(cat_id), first, first + len(pending) - 1)
+            rows = self._rows[cat_id]
+            for offset, name in enumerate(pending):
+                rows[name] = first + offset
+            self._children[cat_id].extend(pending)
+            self._pending[cat_id] = []
+            self.endInsertRows()
+
+    def add_object(self, cat_id: int, name: str) -> None:
+        if self.contains(cat_id, name):
+            return
+        if self._bulk:
+            self._pending[cat_id].append(name)
+            return
+        row = len(self._children[cat_id])
+        self.beginInsertRows(self.category_index(cat_id), row, row)
+        self._children[cat_id].append(name)
+        self._rows[cat_id][name] = row
+        self.endInsertRows()
+
+    def remove_object(self, cat_id: int, name: str) -> None:
+        if name in self._pending[cat_id]:
+            self._pending[cat_id].remove(name)
+            return
+        row = self._rows[cat_id].pop(name, None)
+        if row is None:
+            return
+        self.beginRemoveRows(self.category_index(cat_id), row, row)
+        del self._children[cat_id][row]
+        # Rows after the removed one shift up by one.
+        rows = self._rows[cat_id]
+        for other, r in rows.items():
+            if r > row:
+                rows[other] = r - 1
+        self.endRemoveRows()
+
+
+class LazyRef:
+    """
+    Placeholder registered for a dependency that has not been loaded yet.
+
+    Holds only the category and name so the Project Explorer can list the
+    object; the real instance is loaded from disk on first access through
+    MainWindow._resolve_store_entry.
+    """
+    __slots__ = ("category", "name")
+
+    def __init__(self, category: str, name: str):
+        self.category = category
+        self.name = name
+
+
 class MainWindow(QMainWindow):
     """
     The main application window containing the workspace, sidebar, and tools.
@@ -261,17 +538,51 @@ class MainWindow(QMainWindow):
         self.twist_structures: Dict[str, TwistStructure] = {}
         self.worlds: Dict[str, World] = {}
         self.models: Dict[str, Model] = {}
+        # Stores indexed by Kind, so category lookups are a list index.
+        self._stores = [self.lattices, self.residuated_lattices,
+                        self.twist_structures, self.worlds, self.models]
         
         # Default propositions
         self.props: Set[str] = {"p", "q", "r", "s"}
 
-        # Tree categories mapping (Label -> TreeItem)
-        self.tree_categories: Dict[str, QTreeWidgetItem] = {}
+        # Set while a batch of objects is being registered so per-object
+        # combo refreshes are deferred to a single refresh at the end.
+        self._bulk_loading = False
+
+        # Dependency registration: dispatch by concrete type, with a
+        # per-pass visited set so shared dependencies are descended once.
+        self._registered_ids: Set[int] = set()
+        self._register_handlers = {
+            Model: self._register_model_deps,
+            TwistStructure: self._register_twist_deps,
+            ResiduatedLattice: self._register_resid_deps,
+            World: self._register_world_deps,
+        }
+
+        # Tree categories mapping (Label -> category ID in the WorkspaceModel)
+        self.tree_categories: Dict[str, int] = {}
+
+        # Points at the module-level color dict for the active theme.
+        self._theme_colors: Dict[str, str] = _THEME_COLORS_LIGHT
+
+        # Rendered help popups cached per theme (key: is_dark_mode).
+        self._legend_cache: Dict[bool, str] = {}
+        self._defs_cache: Dict[bool, str] = {}
+
+        # Evaluation results keyed by (formula, model name, world name);
+        # cleared whenever the workspace changes.
+        self._eval_cache: Dict[tuple, tuple] = {}
 
         # Initialize UI
         self.setup_ui()
         self.create_menu()
         
+        # Force Fusion style once so palettes work consistently across OS;
+        # setStyle re-polishes every widget, so it must not run per toggle.
+        app = QApplication.instance()
+        if app.style().objectName() != "fusion":
+            app.setStyle("Fusion")
+
         # Load User Config and Apply Theme
         self.load_user_config()
         self.apply_theme()
@@ -296,41 +607,27 @@ class MainWindow(QMainWindow):
         self.save_user_config()
         
         # Re-render details text if something is selected to match theme
-        item = self.tree.currentItem()
-        if item: 
-            self.on_tree_item_clicked(item)
+        index = self.tree.currentIndex()
+        if index.isValid():
+            self.on_tree_item_clicked(index)
 
     def apply_theme(self) -> None:
         """Applies the selected theme (Dark/Light) to the entire application."""
         app = QApplication.instance()
-        
-        # Force Fusion style to ensure palettes work consistently across OS
-        app.setStyle("Fusion")
-        
-        if self.is_dark_mode:
-            app.setStyleSheet(DARK_STYLESHEET)
-            self.btn_legend.setStyleSheet("font-weight: bold; color: #5dade2;")
-            if hasattr(self, 'action_dark_mode'):
-                self.action_dark_mode.setText("Toggle Light Mode")
-        else:
-            app.setStyleSheet(LIGHT_STYLESHEET)
-            self.btn_legend.setStyleSheet("font-weight: bold; color: #2980b9;")
-            if hasattr(self, 'action_dark_mode'):
-                self.action_dark_mode.setText("Toggle Dark Mode")
+
+        self._theme_colors = _THEME_COLORS_DARK if self.is_dark_mode else _THEME_COLORS_LIGHT
+
+        stylesheet = _THEMES[self.is_dark_mode]
+        if app.styleSheet() == stylesheet:
+            return  # Theme already applied; skip the stylesheet reparse.
+        app.setStyleSheet(stylesheet)
+
+        if hasattr(self, 'action_dark_mode'):
+            self.action_dark_mode.setText("Toggle Light Mode" if self.is_dark_mode else "Toggle Dark Mode")
 
     def get_theme_color(self, role: str) -> str:
         """Returns hex color code based on current theme for HTML generation."""
-        colors = {
-            "header": ("#2c3e50", "#aaddff"), # Dark Blue / Light Blue
-            "accent": ("#8e44ad", "#d1c4e9"), # Purple / Light Purple
-            "warn":   ("#d35400", "#ffcc80"), # Orange / Light Orange
-            "info":   ("#2980b9", "#81d4fa"), # Blue / Cyan
-            "error":  ("#c0392b", "#ff8a80"), # Red / Light Red
-            "text":   ("#000000", "#ffffff"), # Black / White
-            "subtle": ("#7f8c8d", "#b0bec5")  # Gray / Light Gray
-        }
-        idx = 1 if self.is_dark_mode else 0
-        return colors.get(role, ("black", "white"))[idx]
+        return self._theme_colors.get(role, "black")
 
     # ==========================================
     #               UI SETUP
@@ -354,17 +651,21 @@ class MainWindow(QMainWindow):
         
         # 1. Project Explorer (Tree)
         label_list = QLabel("Project Explorer:")
-        label_list.setStyleSheet("font-weight: bold;")
+        label_list.setObjectName("sectionHeader")
         left_layout.addWidget(label_list)
 
-        self.tree = QTreeWidget()
+        self.tree = QTreeView()
+        # All rows are plain text, so let Qt skip per-row height computation.
+        self.tree.setUniformRowHeights(True)
+        self.tree.setAnimated(False)
+        self.tree.setExpandsOnDoubleClick(False)
         self.tree.setHeaderHidden(True)
         self.tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.tree.customContextMenuRequested.connect(self.open_tree_context_menu)
         left_layout.addWidget(self.tree)
         self.init_tree_categories()
 
-        self.tree.itemClicked.connect(self.on_tree_item_clicked)
+        self.tree.clicked.connect(self.on_tree_item_clicked)
 
         # 2. Visual Separator
         line = QFrame()
@@ -374,7 +675,7 @@ class MainWindow(QMainWindow):
 
         # 3. Propositions Section
         label_props = QLabel("Propositions:")
-        label_props.setStyleSheet("font-weight: bold; margin-top: 10px;")
+        label_props.setObjectName("sectionHeaderSpaced")
         left_layout.addWidget(label_props)
 
         self.prop_list_widget = QListWidget()
@@ -406,7 +707,7 @@ class MainWindow(QMainWindow):
 
         # 1. Details Section
         label_details = QLabel("Object Details:")
-        label_details.setStyleSheet("font-weight: bold;")
+        label_details.setObjectName("sectionHeader")
         right_layout.addWidget(label_details)
 
         self.details_text = QTextEdit()
@@ -437,7 +738,7 @@ class MainWindow(QMainWindow):
 
         # 2. Formula Interpreter Section
         label_eval = QLabel("Formula Interpreter:")
-        label_eval.setStyleSheet("font-weight: bold; margin-top: 10px;")
+        label_eval.setObjectName("sectionHeaderSpaced")
         right_layout.addWidget(label_eval)
 
         # A. Context Selection (Model + World)
@@ -448,11 +749,15 @@ class MainWindow(QMainWindow):
         self.combo_models = QComboBox()
         self.combo_models.setPlaceholderText("Select PLTS")
         self.combo_models.setMinimumWidth(150)
+        self._model_names = QStringListModel(self)
+        self.combo_models.setModel(self._model_names)
         self.combo_models.currentIndexChanged.connect(self.update_world_combo)
         
         self.combo_worlds = QComboBox()
         self.combo_worlds.setPlaceholderText("Select State")
         self.combo_worlds.setMinimumWidth(150)
+        self._world_names = QStringListModel(self)
+        self.combo_worlds.setModel(self._world_names)
         
         selection_layout.addWidget(QLabel("PLTS:"))
         selection_layout.addWidget(self.combo_models)
@@ -468,27 +773,16 @@ class MainWindow(QMainWindow):
         symbols_layout.setSpacing(2)
         
         # (Label, InsertText)
-        symbol_map = [
-            ("□", "[a]"), 
-            ("◇", "<a>"), 
-            ("¬", "~"), 
-            ("▷", "->"),
-            ("▷◁", "<->"),  
-            ("∧", "&"), 
-            ("∨", "|"), 
-            ("⊥", "0"),
-            ("⊤", "1")
-        ]
-
-        for label, insert_text in symbol_map:
+        for label, insert_text in _SYMBOL_MAP:
             btn = QPushButton(label)
             btn.setFixedWidth(30)
             btn.setToolTip(f"Insert {insert_text}")
-            btn.clicked.connect(lambda checked, t=insert_text: self.insert_symbol(t))
+            btn.clicked.connect(partial(self.insert_symbol, insert_text))
             symbols_layout.addWidget(btn)
 
         # LEGEND BUTTON
         self.btn_legend = QPushButton("?")
+        self.btn_legend.setObjectName("legendButton")
         self.btn_legend.setFixedWidth(30)
         self.btn_legend.setToolTip("Show Symbol Legend")
         self.btn_legend.clicked.connect(self.show_symbol_legend)
@@ -519,10 +813,10 @@ class MainWindow(QMainWindow):
         result_layout = QHBoxLayout()
         
         self.result_label = QLabel("Result: ")
-        self.result_label.setStyleSheet("font-weight: bold; font-size: 14px;")
+        self.result_label.setObjectName("resultLabel")
         
         self.validity_label = QLabel("")
-        self.validity_label.setStyleSheet("font-weight: bold; font-size: 14px; margin-left: 20px;")
+        self.validity_label.setObjectName("validityLabel")
         
         result_layout.addWidget(self.result_label, alignment=Qt.AlignmentFlag.AlignTop)
         result_layout.addWidget(self.validity_label, alignment=Qt.AlignmentFlag.AlignTop)
@@ -535,16 +829,21 @@ class MainWindow(QMainWindow):
         splitter.addWidget(right_widget)
         splitter.setSizes([300, 700])
 
-    def insert_symbol(self, text: str) -> None:
+    def insert_symbol(self, text: str, _checked: bool = False) -> None:
         """Helper to insert symbol from button click into input field."""
         self.formula_input.insert(text)
         self.formula_input.setFocus()
 
     def show_symbol_legend(self) -> None:
         """Displays a popup table explaining the math symbols."""
+        msg = self._legend_cache.get(self.is_dark_mode)
+        if msg is not None:
+            QMessageBox.information(self, "Symbol Legend", msg)
+            return
+
         text_col = "white" if self.is_dark_mode else "black"
         bg_col = "#333" if self.is_dark_mode else "#f0f0f0"
-        
+
         msg = f"""
         <h3 style='color:{self.get_theme_color('info')};'>Symbol Legend</h3>
         <table border="1" cellpadding="4" cellspacing="0" style='border-collapse: collapse; color:{text_col};'>
@@ -562,13 +861,19 @@ class MainWindow(QMainWindow):
             <tr><td>⊤</td><td>1 / TOP</td><td>Top</td><td>Absolute True (1, 0)</td></tr>
         </table>
         """
+        self._legend_cache[self.is_dark_mode] = msg
         QMessageBox.information(self, "Symbol Legend", msg)
 
     def show_definitions(self) -> None:
         """Displays mathematical definitions."""
+        msg = self._defs_cache.get(self.is_dark_mode)
+        if msg is not None:
+            QMessageBox.information(self, "Definitions", msg)
+            return
+
         c_head = self.get_theme_color("header")
         c_text = self.get_theme_color("text")
-        
+
         msg = f"""
         <div style='color:{c_text};'>
         <h3 style='color:{c_head};'>Paraconsistent Definitions</h3>
@@ -592,61 +897,71 @@ class MainWindow(QMainWindow):
         <p>Global Satisfaction:</b> ⊓<sub>w∈W</sub> (w ⊨<sub>M</sub> φ)</p>
         </div>
         """
+        self._defs_cache[self.is_dark_mode] = msg
         QMessageBox.information(self, "Definitions", msg)
 
     def init_tree_categories(self) -> None:
-        """Creates the top-level category items in the Tree Widget."""
-        categories = ["Lattices", "Residuated Lattices", "Twist Structures", "States", "PLTSs"]
-        for cat in categories:
-            item = QTreeWidgetItem(self.tree)
-            item.setText(0, cat)
-            item.setExpanded(True)
-            self.tree_categories[cat] = item
+        """Creates the workspace model behind the Project Explorer tree."""
+        self.tree_model = WorkspaceModel(self)
+        self.tree.setModel(self.tree_model)
+        self.tree_categories = {cat: i for i, cat in enumerate(WorkspaceModel.CATEGORIES)}
+        # One bulk expand with paints deferred instead of a repaint per category.
+        self.tree.setUpdatesEnabled(False)
+        self.tree.expandAll()
+        self.tree.setUpdatesEnabled(True)
 
     def create_menu(self) -> None:
-        """Initializes the application menu bar actions."""
+        """Initializes the menu bar; object menus are populated on first open."""
         menu_bar = self.menuBar()
 
-        # --- NEW MENU ---
-        new_menu = menu_bar.addMenu("New")
-        new_menu.addAction("Lattice").triggered.connect(self.create_new_lattice)
-        new_menu.addAction("Residuated Lattice").triggered.connect(self.create_new_residuated_lattice)
-        new_menu.addAction("Twist Structure").triggered.connect(self.create_new_twist_structure)
-        new_menu.addAction("State").triggered.connect(self.create_new_world)
-        new_menu.addAction("PLTS").triggered.connect(self.create_new_model)
+        # Defer QAction construction until a menu is actually shown.
+        self._menus_populated: Set[str] = set()
+        for title, populate in (
+            ("New", self._populate_new_menu),
+            ("Load", self._populate_load_menu),
+            ("Delete", self._populate_delete_menu),
+            ("See", self._populate_see_menu),
+        ):
+            menu = menu_bar.addMenu(title)
+            menu.aboutToShow.connect(partial(self._populate_menu_once, title, menu, populate))
 
-        # --- LOAD MENU ---
-        load_menu = menu_bar.addMenu("Load")
-        load_menu.addAction("Lattice").triggered.connect(lambda: self.load_specific_object("Lattice", "lattices", "name"))
-        load_menu.addAction("Residuated Lattice").triggered.connect(lambda: self.load_specific_object("Residuated Lattice", "residuated_lattices", "name_residuated_lattice"))
-        load_menu.addAction("Twist Structure").triggered.connect(lambda: self.load_specific_object("Twist Structure", "twist_structures", "name"))
-        load_menu.addAction("State").triggered.connect(lambda: self.load_specific_object("World", "worlds", "world_name"))
-        load_menu.addAction("PLTS").triggered.connect(lambda: self.load_specific_object("Model", "models", "model_name"))
-        
-        # --- DELETE MENU ---
-        del_menu = menu_bar.addMenu("Delete")
-        del_menu.addAction("Lattice").triggered.connect(lambda: self.delete_specific_object("Lattice", "lattices", "name"))
-        del_menu.addAction("Residuated Lattice").triggered.connect(lambda: self.delete_specific_object("Residuated Lattice", "residuated_lattices", "name_residuated_lattice"))
-        del_menu.addAction("Twist Structure").triggered.connect(lambda: self.delete_specific_object("Twist Structure", "twist_structures", "name"))
-        del_menu.addAction("State").triggered.connect(lambda: self.delete_specific_object("World", "worlds", "world_name"))
-        del_menu.addAction("PLTS").triggered.connect(lambda: self.delete_specific_object("Model", "models", "model_name"))
-        
-        # --- SEE MENU ---
-        see_menu = menu_bar.addMenu("See")
-        see_menu.addAction("Lattices in File").triggered.connect(lambda: self.see_objects_in_file("lattices", "name"))
-        see_menu.addAction("Residuated Lattices in File").triggered.connect(lambda: self.see_objects_in_file("residuated_lattices", "name_residuated_lattice"))
-        see_menu.addAction("Twist Structures in File").triggered.connect(lambda: self.see_objects_in_file("twist_structures", "name"))
-        see_menu.addAction("States in File").triggered.connect(lambda: self.see_objects_in_file("worlds", "world_name"))
-        see_menu.addAction("PLTSs in File").triggered.connect(lambda: self.see_objects_in_file("models", "model_name"))
-        
         # --- VIEW MENU (Dark Mode) ---
+        # Built eagerly: apply_theme updates the toggle action's text.
         view_menu = menu_bar.addMenu("View")
         self.action_dark_mode = QAction("Toggle Dark Mode", self)
         self.action_dark_mode.triggered.connect(self.toggle_dark_mode)
         view_menu.addAction(self.action_dark_mode)
-        
-        # --- HELP MENU (Definitions) ---
+
+        # --- HELP MENU (also lazily populated) ---
         help_menu = menu_bar.addMenu("Help")
+        help_menu.aboutToShow.connect(partial(self._populate_menu_once, "Help", help_menu, self._populate_help_menu))
+
+    def _populate_menu_once(self, title: str, menu: QMenu, populate) -> None:
+        if title in self._menus_populated:
+            return
+        self._menus_populated.add(title)
+        populate(menu)
+
+    def _populate_new_menu(self, new_menu: QMenu) -> None:
+        new_menu.addAction("Lattice").triggered.connect(self.create_new_lattice)
+        new_menu.addAction("Residuated Lattice").triggered.connect(self.create_new_residuated_lattice)
+        new_menu.addAction("Twist Structure").triggered.connect(self.create_new_twist_structure)
+        new_menu.addAction("State").triggered.connect(self.create_new_world)
+        new_menu.addAction("PLTS").triggered.connect(self.create_new_model)
+
+    def _populate_load_menu(self, load_menu: QMenu) -> None:
+        for kind in _OBJECT_KINDS:
+            load_menu.addAction(kind.display).triggered.connect(partial(self.load_specific_object, kind))
+
+    def _populate_delete_menu(self, del_menu: QMenu) -> None:
+        for kind in _OBJECT_KINDS:
+            del_menu.addAction(kind.display).triggered.connect(partial(self.delete_specific_object, kind))
+
+    def _populate_see_menu(self, see_menu: QMenu) -> None:
+        for kind in _OBJECT_KINDS:
+            see_menu.addAction(f"{kind.tree_category} in File").triggered.connect(partial(self.see_objects_in_file, kind))
+
+    def _populate_help_menu(self, help_menu: QMenu) -> None:
         help_menu.addAction("Mathematical Definitions").triggered.connect(self.show_definitions)
         help_menu.addAction("Symbol Legend").triggered.connect(self.show_symbol_legend)
 
@@ -655,228 +970,206 @@ class MainWindow(QMainWindow):
     # ==========================================
 
     def refresh_model_combo(self) -> None:
+        """Resynchronizes the PLTS combo with self.models in a single model reset."""
         self.combo_models.blockSignals(True)
-        self.combo_models.clear()
-        self.combo_models.addItems(list(self.models.keys()))
+        self._model_names.setStringList(list(self.models.keys()))
         self.combo_models.blockSignals(False)
         self.update_world_combo()
 
+    def _add_model_combo_entry(self, name: str) -> None:
+        row = self._model_names.rowCount()
+        self._model_names.insertRow(row)
+        self._model_names.setData(self._model_names.index(row), name)
+
+    def _remove_model_combo_entry(self, name: str) -> None:
+        row = self.combo_models.findText(name)
+        if row >= 0:
+            self._model_names.removeRow(row)
+
     def update_world_combo(self) -> None:
-        self.combo_worlds.clear()
-        model_name = self.combo_models.currentText()
-        if model_name in self.models:
-            model = self.models[model_name]
-            world_names = sorted([w.name_long for w in model.worlds])
-            self.combo_worlds.addItems(world_names)
+        model = self.models.get(self.combo_models.currentText())
+        self._world_names.setStringList(model.sorted_world_names() if model else [])
 
     def refresh_props_ui(self) -> None:
+        self._sorted_props = sorted(self.props)
         self.prop_list_widget.clear()
-        for p in sorted(list(self.props)):
-            self.prop_list_widget.addItem(p)
+        self.prop_list_widget.addItems(self._sorted_props)
 
     def add_proposition(self) -> None:
         text, ok = QInputDialog.getText(self, "Add Propositions", "Enter propositions, e.g: p, q, r:")
-        if ok and text:
-            for item in text.split(','):
-                p = item.strip()
-                if p: self.props.add(p)
-            self.refresh_props_ui()
+        if not (ok and text):
+            return
+        for item in text.split(','):
+            p = item.strip()
+            if not p or p in self.props:
+                continue
+            self.props.add(p)
+            # Insert into the widget at its sorted position rather than
+            # clearing and rebuilding the whole list.
+            row = bisect_left(self._sorted_props, p)
+            insort(self._sorted_props, p)
+            self.prop_list_widget.insertItem(row, p)
 
     def remove_proposition(self) -> None:
-        for item in self.prop_list_widget.selectedItems():
-            if item.text() in self.props: self.props.remove(item.text())
-        self.refresh_props_ui()
+        rows = sorted((self.prop_list_widget.row(item) for item in self.prop_list_widget.selectedItems()), reverse=True)
+        for row in rows:
+            p = self._sorted_props.pop(row)
+            self.props.discard(p)
+            self.prop_list_widget.takeItem(row)
 
     # ==========================================
     #            OBJECT MANAGEMENT
     # ==========================================
 
     def is_object_loaded(self, category: str, name: str) -> bool:
-        if category == "Lattice": return name in self.lattices
-        if category == "Residuated Lattice": return name in self.residuated_lattices
-        if category == "Twist Structure": return name in self.twist_structures
-        if category == "World": return name in self.worlds
-        if category == "Model": return name in self.models
-        return False
+        kind = _KINDS_BY_LABEL.get(category)
+        return kind is not None and name in self._stores[kind.store]
+
+    def _resolve_store_entry(self, category: str, name: str) -> Any:
+        """Returns the object for (category, name), loading lazy stubs on demand."""
+        kind = _KINDS_BY_LABEL.get(category)
+        if kind is None:
+            return None
+        store = self._stores[kind.store]
+        obj = store.get(name)
+        if isinstance(obj, LazyRef):
+            obj = kind.loader(kind.filename, name)
+            if obj is not None:
+                store[name] = obj
+        return obj
 
     def register_object(self, name: str, obj: Any, type_str: str) -> None:
-        if type_str == "Lattice": self.lattices[name] = obj
-        elif type_str == "Residuated Lattice": self.residuated_lattices[name] = obj
-        elif type_str == "Twist Structure": self.twist_structures[name] = obj
-        elif type_str == "World": self.worlds[name] = obj
-        elif type_str == "Model": self.models[name] = obj
-        
-        cat_map = {"Lattice": "Lattices", "Residuated Lattice": "Residuated Lattices", "Twist Structure": "Twist Structures", "World": "States", "Model": "PLTSs"}
-        cat = cat_map.get(type_str)
-        if cat and cat in self.tree_categories:
-            parent = self.tree_categories[cat]
-            if not any(parent.child(i).text(0) == name for i in range(parent.childCount())):
-                item = QTreeWidgetItem(parent)
-                item.setText(0, name)
-        if type_str == "Model": self.refresh_model_combo()
+        kind = _KINDS_BY_LABEL.get(type_str)
+        if kind is None:
+            return
+        self._stores[kind.store][name] = obj
+        self._eval_cache.clear()
+
+        if kind.tree_category in self.tree_categories:
+            self.tree_model.add_object(self.tree_categories[kind.tree_category], name)
+        if type_str == "Model" and not self._bulk_loading:
+            self._add_model_combo_entry(name)
 
     def remove_from_tree(self, category_label: str, object_name: str) -> None:
-        root_item = self.tree_categories.get(category_label)
-        if not root_item: return
-        for i in range(root_item.childCount()):
-            child = root_item.child(i)
-            if child.text(0) == object_name:
-                root_item.removeChild(child)
-                break
-
-    def remove_object_from_memory(self, ui_category: str, tree_category_label: str, object_name: str) -> None:
-        memory_map = {
-            "Lattice": self.lattices,
-            "Residuated Lattice": self.residuated_lattices,
-            "Twist Structure": self.twist_structures,
-            "World": self.worlds,
-            "Model": self.models,
-        }
-        memory_dict = memory_map.get(ui_category)
-        if memory_dict and object_name in memory_dict:
+        cat_id = self.tree_categories.get(category_label)
+        if cat_id is None: return
+        self.tree_model.remove_object(cat_id, object_name)
+
+    def remove_object_from_memory(self, ui_category: str, object_name: str) -> None:
+        kind = _KINDS_BY_LABEL.get(ui_category)
+        if kind is None:
+            return
+        memory_dict = self._stores[kind.store]
+        if object_name in memory_dict:
             del memory_dict[object_name]
-            self.remove_from_tree(tree_category_label, object_name)
+            self._eval_cache.clear()
+            self.remove_from_tree(kind.tree_category, object_name)
             self.details_text.clear()
             self.statusBar().showMessage(f"Removed '{object_name}' from workspace.", 2000)
             
-            if ui_category == "Model": self.refresh_model_combo()
+            if ui_category == "Model": self._remove_model_combo_entry(object_name)
 
     # ==========================================
     #             FILE OPERATIONS
     # ==========================================
 
-    def see_objects_in_file(self, json_key: str, name_key: str) -> None:
-        filename_map = {
-            "lattices": "json_files/lattices.json",
-            "residuated_lattices": "json_files/residuated_lattices.json",
-            "twist_structures": "json_files/twist_structures.json",
-            "worlds": "json_files/worlds.json",
-            "models": "json_files/models.json"
-        }
-        fname = filename_map.get(json_key)
-        if not fname: return
-
-        names = JSONHandler.get_names_from_json(fname, json_key, name_key)
+    def see_objects_in_file(self, kind: ObjectKind, _checked: bool = False) -> None:
+        names = JSONHandler.get_names_from_json(kind.filename, kind.json_key, kind.name_key)
         display_text = "\n".join(names) if names else "No items found."
-        QMessageBox.information(self, f"File Content: {fname}", display_text)
+        QMessageBox.information(self, f"File Content: {kind.filename}", display_text)
 
     def _recursive_register(self, obj: Any) -> None:
         """
         Recursively registers dependencies of an object to ensure they appear in the UI.
         Traverses Model -> TwistStructure -> ResiduatedLattice -> Lattice.
         """
-        if isinstance(obj, Model):
-            self._recursive_register(obj.twist_structure)
-            for w in obj.worlds:
-                # Ensure world's twist structure is loaded
-                self._recursive_register(w.twist_structure)
-                
-                if not self.is_object_loaded("World", w.name_long):
-                    self.register_object(w.name_long, w, "World")
-        
-        elif isinstance(obj, TwistStructure):
-            if not self.is_object_loaded("Twist Structure", obj.name):
-                self.register_object(obj.name, obj, "Twist Structure")
-            self._recursive_register(obj.residuated_lattice)
-            
-        elif isinstance(obj, ResiduatedLattice):
-            if not self.is_object_loaded("Residuated Lattice", obj.name_residuated_lattice):
-                self.register_object(obj.name_residuated_lattice, obj, "Residuated Lattice")
-            
-            # Load and register the base Lattice if not present
-            base_name = obj.name
-            if not self.is_object_loaded("Lattice", base_name):
-                base_lat = JSONHandler.load_lattice_from_json("json_files/lattices.json", base_name)
-                if base_lat:
-                    self.register_object(base_name, base_lat, "Lattice")
-        
-        elif isinstance(obj, World):
-             self._recursive_register(obj.twist_structure)
-
-    def load_specific_object(self, ui_category: str, json_key: str, name_key: str) -> None:
-        filename_map = {
-            "Lattice": "json_files/lattices.json",
-            "Residuated Lattice": "json_files/residuated_lattices.json",
-            "Twist Structure": "json_files/twist_structures.json",
-            "World": "json_files/worlds.json",
-            "Model": "json_files/models.json"
-        }
-        
-        fname = filename_map.get(ui_category)
-        
-        if not fname: 
-            print(f"Error: Unknown category {ui_category}")
+        try:
+            self._register_dependencies(obj)
+        finally:
+            self._registered_ids.clear()
+
+    def _register_dependencies(self, obj: Any) -> None:
+        # Skip objects already visited during this registration pass, so a
+        # twist structure shared by N worlds is descended into only once.
+        if id(obj) in self._registered_ids:
             return
-        
-        name_map = {"Model": "PLTS", "World": "State"}
-        display_name = name_map.get(ui_category, ui_category)
+        self._registered_ids.add(id(obj))
+
+        handler = self._register_handlers.get(type(obj))
+        if handler:
+            handler(obj)
+
+    def _register_model_deps(self, obj: Model) -> None:
+        self._register_dependencies(obj.twist_structure)
+        for w in obj.worlds:
+            # Ensure world's twist structure is loaded
+            self._register_dependencies(w.twist_structure)
+
+            if not self.is_object_loaded("World", w.name_long):
+                self.register_object(w.name_long, w, "World")
+
+    def _register_twist_deps(self, obj: TwistStructure) -> None:
+        if not self.is_object_loaded("Twist Structure", obj.name):
+            self.register_object(obj.name, obj, "Twist Structure")
+        self._register_dependencies(obj.residuated_lattice)
+
+    def _register_resid_deps(self, obj: ResiduatedLattice) -> None:
+        if not self.is_object_loaded("Residuated Lattice", obj.name_residuated_lattice):
+            self.register_object(obj.name_residuated_lattice, obj, "Residuated Lattice")
+
+        # Register the base Lattice as a stub; the disk load is deferred
+        # until the user actually inspects it.
+        base_name = obj.name
+        if not self.is_object_loaded("Lattice", base_name):
+            self.register_object(base_name, LazyRef("Lattice", base_name), "Lattice")
 
-        names = JSONHandler.get_names_from_json(fname, json_key, name_key)
+    def _register_world_deps(self, obj: World) -> None:
+        self._register_dependencies(obj.twist_structure)
+
+    def load_specific_object(self, kind: ObjectKind, _checked: bool = False) -> None:
+        names = JSONHandler.get_names_from_json(kind.filename, kind.json_key, kind.name_key)
         if not names:
-            QMessageBox.information(self, f"Load {display_name}", f"No objects found in {fname}.")
+            QMessageBox.information(self, f"Load {kind.display}", f"No objects found in {kind.filename}.")
             return
 
-        dialog = MultiSelectDialog(f"Load {display_name}", names, self)
+        dialog = MultiSelectDialog(f"Load {kind.display}", names, self)
         if dialog.exec():
-            for selected_name in dialog.get_selected_items():
-                if self.is_object_loaded(ui_category, selected_name): continue
-                
-                try:
-                    obj = None
-                    if ui_category == "Lattice":
-                        obj = JSONHandler.load_lattice_from_json(fname, selected_name)
-                    elif ui_category == "Residuated Lattice":
-                        obj = JSONHandler.load_residuated_lattice_from_json(fname, selected_name)
-                    elif ui_category == "Twist Structure":
-                        obj = JSONHandler.load_twist_structure_from_json(fname, selected_name)
-                    elif ui_category == "World":
-                        obj = JSONHandler.load_world_from_json(fname, selected_name)
-                    elif ui_category == "Model":
-                        obj = JSONHandler.load_model_from_json(fname, selected_name)
-
-                    if obj:
-                        self.register_object(selected_name, obj, ui_category)
-                        # TRIGGER RECURSIVE LOADING
-                        self._recursive_register(obj)
-                        
-                        self.statusBar().showMessage(f"Loaded {selected_name} and dependencies.", 3000)
-                except Exception as e:
-                    print(f"Failed to load {selected_name}: {e}")
-
-    def delete_specific_object(self, ui_category: str, json_key: str, name_key: str) -> None:
-        filename_map = {
-            "Lattice": "json_files/lattices.json",
-            "Residuated Lattice": "json_files/residuated_lattices.json",
-            "Twist Structure": "json_files/twist_structures.json",
-            "World": "json_files/worlds.json",
-            "Model": "json_files/models.json"
-        }
-        fname = filename_map.get(ui_category)
-        if not fname: return
+            self._bulk_loading = True
+            self.tree_model.begin_bulk_load()
+            try:
+                self._load_selected_objects(kind, dialog.get_selected_items())
+            finally:
+                self._bulk_loading = False
+                self.tree_model.end_bulk_load()
+            self.refresh_model_combo()
+
+    def _load_selected_objects(self, kind: ObjectKind, selected_names) -> None:
+        for selected_name in selected_names:
+            if self.is_object_loaded(kind.label, selected_name): continue
+
+            try:
+                obj = kind.loader(kind.filename, selected_name)
+                if obj:
+                    self.register_object(selected_name, obj, kind.label)
+                    # TRIGGER RECURSIVE LOADING
+                    self._recursive_register(obj)
+                    
+                    self.statusBar().showMessage(f"Loaded {selected_name} and dependencies.", 3000)
+            except Exception as e:
+                print(f"Failed to load {selected_name}: {e}")
 
-        names = JSONHandler.get_names_from_json(fname, json_key, name_key)
-        name_map = {"Model": "PLTS", "World": "State"}
-        display_name = name_map.get(ui_category, ui_category)
-        dialog = MultiSelectDialog(f"Delete {display_name}", names, self)
+    def delete_specific_object(self, kind: ObjectKind, _checked: bool = False) -> None:
+        names = JSONHandler.get_names_from_json(kind.filename, kind.json_key, kind.name_key)
+        dialog = MultiSelectDialog(f"Delete {kind.display}", names, self)
         if dialog.exec():
             to_delete = dialog.get_selected_items()
             if not to_delete: return
             
             if QMessageBox.question(self, "Confirm", f"Delete {len(to_delete)} items?", 
                                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No) == QMessageBox.StandardButton.Yes:
-                
-                config = {
-                    "Lattice": (JSONHandler.delete_lattice_from_json, "Lattices"),
-                    "Residuated Lattice": (JSONHandler.delete_residuated_lattice_from_json, "Residuated Lattices"),
-                    "Twist Structure": (JSONHandler.delete_twist_structure_from_json, "Twist Structures"),
-                    "World": (JSONHandler.delete_world_from_json, "States"),
-                    "Model": (JSONHandler.delete_model_from_json, "PLTSs")
-                }
-                
-                handler, tree_cat = config[ui_category]
+                JSONHandler.delete_entries_from_json(kind.filename, kind.json_key, kind.name_key, to_delete)
                 for name in to_delete:
-                    handler(fname, name)
-                    self.remove_object_from_memory(ui_category, tree_cat, name)
+                    self.remove_object_from_memory(kind.label, name)
 
     # ==========================================
     #            OBJECT CREATION
@@ -902,7 +1195,7 @@ class MainWindow(QMainWindow):
         if dialog.exec():
             name, base_name = dialog.get_data()
             try:
-                base = self.lattices[base_name]
+                base = self._resolve_store_entry("Lattice", base_name)
                 rl = ResiduatedLattice(name, base.name, base.elements, base.relations, base.implication_map)
                 if JSONHandler.save_residuated_lattice_to_json("json_files/residuated_lattices.json", rl):
                     self.register_object(name, rl, "Residuated Lattice")
@@ -942,25 +1235,31 @@ class MainWindow(QMainWindow):
             
             created_count = 0
             errors = []
-            
+
+            # Validate and construct every world first, then write the whole
+            # batch to disk once instead of rewriting the file per world.
+            new_worlds = []
+            seen = set()
             for (long_name, short_name, ts_name, assignments) in worlds_data:
                 try:
-                    if long_name in self.worlds:
+                    if long_name in self.worlds or long_name in seen:
                         errors.append(f"'{long_name}' already exists.")
                         continue
-                        
+
                     ts = self.twist_structures[ts_name]
-                    w = World(long_name, short_name, ts, assignments)
-                    
-                    if JSONHandler.save_world_to_json("json_files/worlds.json", w):
-                        self.register_object(long_name, w, "World")
-                        created_count += 1
-                    else:
-                        errors.append(f"Failed to save '{long_name}' to file.")
-                        
+                    new_worlds.append(World(long_name, short_name, ts, assignments))
+                    seen.add(long_name)
                 except Exception as e:
                     errors.append(f"Error creating '{long_name}': {str(e)}")
-            
+
+            if new_worlds:
+                if JSONHandler.save_worlds_to_json("json_files/worlds.json", new_worlds):
+                    for w in new_worlds:
+                        self.register_object(w.name_long, w, "World")
+                    created_count = len(new_worlds)
+                else:
+                    errors.append("Failed to save new states to file.")
+
             if created_count > 0:
                 msg = f"Successfully created {created_count} worlds."
                 if errors:
@@ -987,18 +1286,19 @@ class MainWindow(QMainWindow):
                 ts = self.twist_structures[ts_name]
                 selected_worlds_objs = {self.worlds[wn] for wn in w_names}
                 
+                worlds_get = self.worlds.get
                 final_rels = {}
                 for action, matrix in rel_data_dict.items():
-                    final_rels[action] = {}
+                    action_rels = final_rels[action] = {}
                     for src_str, targets_map in matrix.items():
-                        if src_str in self.worlds:
-                            src_obj = self.worlds[src_str]
-                            final_rels[action][src_obj] = {}
-                            
-                            for tgt_str, weight in targets_map.items():
-                                if tgt_str in self.worlds:
-                                    tgt_obj = self.worlds[tgt_str]
-                                    final_rels[action][src_obj][tgt_obj] = weight
+                        src_obj = worlds_get(src_str)
+                        if src_obj is None:
+                            continue
+                        action_rels[src_obj] = {
+                            tgt_obj: weight
+                            for tgt_str, weight in targets_map.items()
+                            if (tgt_obj := worlds_get(tgt_str)) is not None
+                        }
 
                 m = Model(name, ts, selected_worlds_objs, final_rels, props, description=description)
                 
@@ -1013,194 +1313,205 @@ class MainWindow(QMainWindow):
     #           VISUALIZATION & LOGIC
     # ==========================================
 
-    def on_tree_item_clicked(self, item: QTreeWidgetItem) -> None:
-        parent = item.parent()
-        if not parent: return
-        cat, name = parent.text(0), item.text(0)
+    def on_tree_item_clicked(self, index: QModelIndex) -> None:
+        parent = index.parent()
+        if not parent.isValid(): return
+        cat, name = parent.data(), index.data()
         
         self.btn_hasse.setEnabled(False)
         self.btn_visualize_model.setEnabled(False)
         
-        html = ""
+        parts = []
 
         def clean_str(obj):
             return str(obj).replace("'", "")
         
         # --- DYNAMIC COLOR HELPER ---
-        c_head = self.get_theme_color("header")
-        c_acc = self.get_theme_color("accent")
-        c_warn = self.get_theme_color("warn")
-        c_info = self.get_theme_color("info")
-        c_err = self.get_theme_color("error")
-        c_text = self.get_theme_color("text")
-        c_sub = self.get_theme_color("subtle")
+        c = self._theme_colors
+        c_head = c["header"]
+        c_acc = c["accent"]
+        c_warn = c["warn"]
+        c_info = c["info"]
+        c_err = c["error"]
+        c_text = c["text"]
+        c_sub = c["subtle"]
 
         if cat == "Lattices" and name in self.lattices:
-            l = self.lattices[name]
+            l = self._resolve_store_entry("Lattice", name)
+            if l is None: return
             self.btn_hasse.setEnabled(True)
             
-            html += f"<h3 style='color:{c_head};'>LATTICE: {l.name}</h3>"
-            html += f"<b>Elements ({len(l.elements)}):</b><br>"
-            clean_elems = [clean_str(e) for e in sorted(list(l.elements))]
-            html += f"<span style='font-family:monospace; color:{c_acc};'>{{{', '.join(clean_elems)}}}</span><br><br>"
+            parts.append(f"<h3 style='color:{c_head};'>LATTICE: {l.name}</h3>")
+            parts.append(f"<b>Elements ({len(l.elements)}):</b><br>")
+            cleaned = {e: clean_str(e) for e in l.elements}
+            clean_elems = [cleaned[e] for e in l.sorted_elements()]
+            parts.append(f"<span style='font-family:monospace; color:{c_acc};'>{{{', '.join(clean_elems)}}}</span><br><br>")
             
-            html += "<b>Relations (≤):</b><br>"
-            rels_fmt = [f"({clean_str(a)},{clean_str(b)})" for a, b in sorted(list(l.relations))]
-            html += f"<span style='font-family:monospace; color:{c_sub};'>{', '.join(rels_fmt)}</span><br><br>"
+            parts.append("<b>Relations (≤):</b><br>")
+            rels_fmt = [f"({cleaned[a]},{cleaned[b]})" for a, b in l.sorted_relations()]
+            parts.append(f"<span style='font-family:monospace; color:{c_sub};'>{', '.join(rels_fmt)}</span><br><br>")
             
-            html += "<b>Implication (→):</b><br>"
+            parts.append("<b>Implication (→):</b><br>")
             if hasattr(l, 'implication_map') and l.implication_map:
-                html += "<table border='0' cellspacing='2' cellpadding='2' style='font-family:monospace;'>"
-                for (a, b), res in sorted(l.implication_map.items(), key=lambda x: str(x[0])):
-                    html += f"<tr><td>{clean_str(a)} → {clean_str(b)}</td><td>= <b>{clean_str(res)}</b></td></tr>"
-                html += "</table>"
+                parts.append("<table border='0' cellspacing='2' cellpadding='2' style='font-family:monospace;'>")
+                for (a, b), res in l.sorted_implication_items():
+                    parts.append(f"<tr><td>{cleaned[a]} → {cleaned[b]}</td><td>= <b>{cleaned[res]}</b></td></tr>")
+                parts.append("</table>")
             else:
-                html += f"<i style='color:{c_sub};'>(Not defined)</i>"
+                parts.append(f"<i style='color:{c_sub};'>(Not defined)</i>")
         
         elif cat == "Residuated Lattices" and name in self.residuated_lattices:
             rl = self.residuated_lattices[name]
             self.btn_hasse.setEnabled(True)
             
-            html += f"<h3 style='color:{c_acc};'>RESIDUATED LATTICE: {rl.name_residuated_lattice}</h3>"
-            html += f"<b>Base Lattice:</b> {rl.name}<br>"
-            clean_elems = [clean_str(e) for e in sorted(list(rl.elements))]
-            html += f"<b>Elements:</b> <span style='font-family:monospace;'>{{{', '.join(clean_elems)}}}</span><br><br>"
+            parts.append(f"<h3 style='color:{c_acc};'>RESIDUATED LATTICE: {rl.name_residuated_lattice}</h3>")
+            parts.append(f"<b>Base Lattice:</b> {rl.name}<br>")
+            cleaned = {e: clean_str(e) for e in rl.elements}
+            clean_elems = [cleaned[e] for e in rl.sorted_elements()]
+            parts.append(f"<b>Elements:</b> <span style='font-family:monospace;'>{{{', '.join(clean_elems)}}}</span><br><br>")
             
-            html += "<b>Implication (Inherited):</b><br>"
+            parts.append("<b>Implication (Inherited):</b><br>")
             if hasattr(rl, 'implication_map') and rl.implication_map:
-                html += "<table border='0' cellspacing='2' cellpadding='2' style='font-family:monospace;'>"
-                for (a, b), res in sorted(rl.implication_map.items(), key=lambda x: str(x[0])):
-                    html += f"<tr><td>{clean_str(a)} → {clean_str(b)}</td><td>= <b>{clean_str(res)}</b></td></tr>"
-                html += "</table>"
+                parts.append("<table border='0' cellspacing='2' cellpadding='2' style='font-family:monospace;'>")
+                for (a, b), res in rl.sorted_implication_items():
+                    parts.append(f"<tr><td>{cleaned[a]} → {cleaned[b]}</td><td>= <b>{cleaned[res]}</b></td></tr>")
+                parts.append("</table>")
             else:
-                html += f"<i style='color:{c_sub};'>(Not defined)</i>"
+                parts.append(f"<i style='color:{c_sub};'>(Not defined)</i>")
         
         elif cat == "Twist Structures" and name in self.twist_structures:
             ts = self.twist_structures[name]
             self.btn_hasse.setEnabled(True)
             
-            html += f"<h3 style='color:{c_warn};'>TWIST STRUCTURE: {name}</h3>"
-            html += f"<b>Base RL:</b> {ts.residuated_lattice.name_residuated_lattice}<br><br>"
+            parts.append(f"<h3 style='color:{c_warn};'>TWIST STRUCTURE: {name}</h3>")
+            parts.append(f"<b>Base RL:</b> {ts.residuated_lattice.name_residuated_lattice}<br><br>")
             
-            html += f"<b>Elements (L x L) [{len(ts.elements)}]:</b><br>"
-            sorted_elems = sorted(list(ts.elements), key=lambda x: (str(x[0]), str(x[1])))
+            parts.append(f"<b>Elements (L x L) [{len(ts.elements)}]:</b><br>")
+            sorted_elems = ts.sorted_elements()
             clean_elems_str = [clean_str(e) for e in sorted_elems]
-            html += f"<span style='font-family:monospace; color:{c_acc};'>{', '.join(clean_elems_str)}</span><br><br>"
+            parts.append(f"<span style='font-family:monospace; color:{c_acc};'>{', '.join(clean_elems_str)}</span><br><br>")
             
-            html += "<b>Truth Ordering (≤<sub>t</sub>):</b><br>"
-            sorted_truth = sorted(list(ts.truth_relation), key=lambda x: (str(x[0]), str(x[1])))
+            parts.append("<b>Truth Ordering (≤<sub>t</sub>):</b><br>")
+            sorted_truth = ts.sorted_truth_relation()
             count = 0
-            html += "<div style='font-family:monospace; font-size:11px;'>"
+            parts.append("<div style='font-family:monospace; font-size:11px;'>")
             for a, b in sorted_truth:
                 if a != b: 
-                    html += f"{clean_str(a)} ≤<sub>t</sub> {clean_str(b)}<br>"
+                    parts.append(f"{clean_str(a)} ≤<sub>t</sub> {clean_str(b)}<br>")
                     count += 1
-            if count == 0: html += f"<i style='color:{c_sub};'>(Reflexive only)</i>"
-            html += "</div><br>"
+            if count == 0: parts.append(f"<i style='color:{c_sub};'>(Reflexive only)</i>")
+            parts.append("</div><br>")
             
         elif cat == "States" and name in self.worlds:
             w = self.worlds[name]
-            html += f"<h3 style='color:{c_info};'>STATE: {w.name_long}</h3>"
-            html += f"<b>Short Name:</b> {w.name_short}<br>"
+            parts.append(f"<h3 style='color:{c_info};'>STATE: {w.name_long}</h3>")
+            parts.append(f"<b>Short Name:</b> {w.name_short}<br>")
             if hasattr(w, 'twist_structure') and w.twist_structure:
-                html += f"<b>Twist Structure:</b> {w.twist_structure.name}<br><br>"
+                parts.append(f"<b>Twist Structure:</b> {w.twist_structure.name}<br><br>")
             
-            html += "<b>Valuations (V):</b><br>"
+            parts.append("<b>Valuations (V):</b><br>")
             if w.assignments:
-                border_c = "#555" if self.is_dark_mode else "#ddd"
-                bg_c = "#333" if self.is_dark_mode else "#f2f2f2"
+                border_c = c["tableBorder"]
+                bg_c = c["tableBg"]
                 
-                html += f"<table border='1' cellspacing='0' cellpadding='4' style='border-collapse:collapse; border-color:{border_c}; font-family:monospace;'>"
-                html += f"<tr style='background-color:{bg_c};'><th>Prop</th><th>Value</th></tr>"
+                parts.append(f"<table border='1' cellspacing='0' cellpadding='4' style='border-collapse:collapse; border-color:{border_c}; font-family:monospace;'>")
+                parts.append(f"<tr style='background-color:{bg_c};'><th>Prop</th><th>Value</th></tr>")
                 for p, v in sorted(w.assignments.items()):
-                    html += f"<tr><td>{p}</td><td style='color:{c_info};'>{clean_str(v)}</td></tr>"
-                html += "</table>"
+                    parts.append(f"<tr><td>{p}</td><td style='color:{c_info};'>{clean_str(v)}</td></tr>")
+                parts.append("</table>")
             else:
-                html += f"<i style='color:{c_sub};'>(No assignments)</i>"
+                parts.append(f"<i style='color:{c_sub};'>(No assignments)</i>")
             
         elif cat == "PLTSs" and name in self.models:
             m = self.models[name]
             self.btn_visualize_model.setEnabled(True)
             
-            html += f"<h3 style='color:{c_err};'>PLTS: {m.name_model}</h3>"
+            parts.append(f"<h3 style='color:{c_err};'>PLTS: {m.name_model}</h3>")
 
             if hasattr(m, 'description') and m.description:
-                html += f"<b>Description:</b><br><i style='color:{c_text};'>{m.description}</i><br><br>"
+                parts.append(f"<b>Description:</b><br><i style='color:{c_text};'>{m.description}</i><br><br>")
             
             if hasattr(m, 'twist_structure') and m.twist_structure:
-                html += f"<b>Twist Structure:</b> {m.twist_structure.name}<br>"
+                parts.append(f"<b>Twist Structure:</b> {m.twist_structure.name}<br>")
             
             world_list = [w.name_short for w in m.worlds]
-            html += f"<b>States ({len(world_list)}):</b> {', '.join(sorted(world_list))}<br>"
+            parts.append(f"<b>States ({len(world_list)}):</b> {', '.join(sorted(world_list))}<br>")
             
             action_list = list(m.actions)
-            html += f"<b>Actions:</b> {', '.join(sorted(action_list))}<br><br>"
+            parts.append(f"<b>Actions:</b> {', '.join(sorted(action_list))}<br><br>")
             
-            html += "<b>Accessibility Relations (R):</b><br>"
+            parts.append("<b>Accessibility Relations (R):</b><br>")
             if not m.actions:
-                html += f"<i style='color:{c_sub};'>(No actions defined)</i>"
+                parts.append(f"<i style='color:{c_sub};'>(No actions defined)</i>")
             else:
                 for action in sorted(list(m.actions)):
-                    html += f"<div style='margin-top:5px; font-weight:bold; color:{c_text};'>[{action}] Transitions:</div>"
-                    rel_map = m.accessibility_relations.get(action, {})
-                    
-                    has_edges = False
+                    parts.append(f"<div style='margin-top:5px; font-weight:bold; color:{c_text};'>[{action}] Transitions:</div>")
+
                     edge_list = []
+                    for src in m.sources(action):
+                        tgt_strs = [f"{t.name_short} <span style='color:{c_sub}; font-size:10px;'>{clean_str(w)}</span>" 
+                                    for t, w in m.successors(action, src)]
+                        edge_list.append(f"{src.name_short} &#8594; {{ {', '.join(tgt_strs)} }}")
                     
-                    sorted_src = sorted(rel_map.keys(), key=lambda w: w.name_short)
-                    for src in sorted_src:
-                        targets = rel_map[src]
-                        if targets:
-                            valid_targets = {tgt: w for tgt, w in targets.items() if w is not None}
-                            if valid_targets:
-                                has_edges = True
-                                tgt_strs = [f"{t.name_short} <span style='color:{c_sub}; font-size:10px;'>{clean_str(w)}</span>" 
-                                            for t, w in valid_targets.items()]
-                                edge_list.append(f"{src.name_short} &#8594; {{ {', '.join(sorted(tgt_strs))} }}")
-                    
-                    if has_edges:
-                        html += f"<div style='margin-left:15px; font-family:monospace; color:{c_text};'>"
-                        html += "<br>".join(edge_list)
-                        html += "</div>"
+                    if edge_list:
+                        parts.append(f"<div style='margin-left:15px; font-family:monospace; color:{c_text};'>")
+                        parts.append("<br>".join(edge_list))
+                        parts.append("</div>")
                     else:
-                        html += f"<div style='margin-left:15px; color:{c_sub}; font-style:italic;'>No transitions</div>"
+                        parts.append(f"<div style='margin-left:15px; color:{c_sub}; font-style:italic;'>No transitions</div>")
 
-        self.details_text.setHtml(html)
+        self.details_text.setHtml("".join(parts))
+
+    def _run_draw(self, draw_fn) -> None:
+        """
+        Runs a plot call with a busy cursor and the draw buttons disabled,
+        so a slow layout cannot trigger re-entrant clicks.
+        """
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        hasse_was_enabled = self.btn_hasse.isEnabled()
+        visualize_was_enabled = self.btn_visualize_model.isEnabled()
+        self.btn_hasse.setEnabled(False)
+        self.btn_visualize_model.setEnabled(False)
+        try:
+            draw_fn()
+        finally:
+            self.btn_hasse.setEnabled(hasse_was_enabled)
+            self.btn_visualize_model.setEnabled(visualize_was_enabled)
+            QApplication.restoreOverrideCursor()
 
     def visualize_current_model(self) -> None:
-        item = self.tree.currentItem()
-        if item and item.parent() and item.parent().text(0) == "PLTSs":
-            model_name = item.text(0)
+        index = self.tree.currentIndex()
+        if index.isValid() and index.parent().isValid() and index.parent().data() == "PLTSs":
+            model_name = index.data()
             if model_name in self.models:
                 try:
-                    self.models[model_name].draw_graph()
+                    self._run_draw(self.models[model_name].draw_graph)
                 except Exception as e:
                     QMessageBox.critical(self, "Error", str(e))
         else:
             QMessageBox.warning(self, "Selection Error", "Please select a PLTS in the Project Explorer tree to visualize.")
 
     def show_current_hasse(self) -> None:
-        item = self.tree.currentItem()
-        if item and item.parent():
-            cat, name = item.parent().text(0), item.text(0)
+        index = self.tree.currentIndex()
+        if index.isValid() and index.parent().isValid():
+            cat, name = index.parent().data(), index.data()
             obj = None
-            if cat == "Lattices": obj = self.lattices.get(name)
+            if cat == "Lattices": obj = self._resolve_store_entry("Lattice", name)
             elif cat == "Residuated Lattices": obj = self.residuated_lattices.get(name)
             elif cat == "Twist Structures": obj = self.twist_structures.get(name)
-            if obj: obj.draw_hasse()
+            if obj: self._run_draw(obj.draw_hasse)
 
     def open_tree_context_menu(self, pos: QPoint) -> None:
-        item = self.tree.itemAt(pos)
-        if item and item.parent():
-            name = item.text(0)
-            cat = item.parent().text(0)
+        index = self.tree.indexAt(pos)
+        if index.isValid() and index.parent().isValid():
+            name = index.data()
+            cat = index.parent().data()
             menu = QMenu()
             action = menu.addAction(f"Remove {name}")
             if menu.exec(self.tree.viewport().mapToGlobal(pos)) == action:
-                cat_map = {"Lattices": "Lattice", "Residuated Lattices": "Residuated Lattice", 
-                           "Twist Structures": "Twist Structure", "States": "World", "PLTSs": "Model"}
-                if cat in cat_map:
-                    self.remove_object_from_memory(cat_map[cat], cat, name)
+                kind = _KINDS_BY_TREE.get(cat)
+                if kind:
+                    self.remove_object_from_memory(kind.label, name)
 
     def evaluate_formula(self) -> None:
         try:
@@ -1223,15 +1534,18 @@ class MainWindow(QMainWindow):
 
             if not world: return
 
-            parser = FormulaParser(f_str)
-            root = parser.parse()
+            cache_key = (f_str, m_name, w_name)
+            res = self._eval_cache.get(cache_key)
+            if res is None:
+                root = parse_formula(f_str)
 
-            unknown = [a for a in root.get_atoms() if a not in world.assignments and a != '0' and a.lower() != 'bot']
-            if unknown:
-                QMessageBox.warning(self, "Error", f"Missing assignments for: {', '.join(unknown)}")
-                return
+                unknown = [a for a in root.get_atoms() if a not in world.assignments and a != '0' and a.lower() != 'bot']
+                if unknown:
+                    QMessageBox.warning(self, "Error", f"Missing assignments for: {', '.join(unknown)}")
+                    return
 
-            res = root.evaluate(model, world, twist)
+                res = compile_formula(f_str)(model, world, twist)
+                self._eval_cache[cache_key] = res
             
             res_str = str(res).replace("'", "")
             self.result_label.setText(f"Result: <b>{res_str}</b>")
@@ -1260,25 +1574,35 @@ class MainWindow(QMainWindow):
 
             model = self.models[m_name]
             twist = model.twist_structure
-            parser = FormulaParser(f_str)
-            root = parser.parse()
+            root = parse_formula(f_str)
+            atoms = root.get_atoms()
+            compiled = compile_formula(f_str)
             
             result_worlds = []
-            result_for_calculation = []
             selected_world_res_str = "Not Found"
 
             sorted_worlds = sorted(model.worlds, key=lambda w: w.name_long)
 
+            rl = twist.residuated_lattice
+            # Identity of the weak meet; absorbed short-circuits further meets.
+            meet_all = (rl.top, rl.bottom)
+            absorbed = False
+
             for world in sorted_worlds:
-                unknown = [a for a in root.get_atoms() if a not in world.assignments and a != '0' and a.lower() != 'bot']
+                unknown = [a for a in atoms if a not in world.assignments and a != '0' and a.lower() != 'bot']
                 if unknown:
                     self.validity_label.setText("Global Satisfaction: Error")
                     QMessageBox.warning(self, "Error", f"State {world.name_short} missing assignments for: {unknown}")
                     return
 
-                res = root.evaluate(model, world, twist)
+                cache_key = (f_str, m_name, world.name_long)
+                res = self._eval_cache.get(cache_key)
+                if res is None:
+                    res = compiled(model, world, twist)
+                    self._eval_cache[cache_key] = res
                 res_str = str(res).replace("'", "")
-                result_for_calculation.append(res)
+                if not absorbed:
+                    meet_all, absorbed = twist.weak_meet_incremental(meet_all, res)
                 
                 if world.name_long == selected_w_name:
                     selected_world_res_str = res_str
@@ -1286,7 +1610,6 @@ class MainWindow(QMainWindow):
                 else:
                     result_worlds.append((world.name_long, res_str))
             
-            meet_all = twist.weak_meet_set(result_for_calculation)
             res_str_meet_all = str(meet_all).replace("'", "")
 
 
@@ -5,13 +5,37 @@ Creates a Lattice with elements, order relations, and an Implication Map.
 """
 
 import itertools
+import sys
 from typing import Tuple, Set, Dict
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QFormLayout, QLineEdit, QDialogButtonBox, 
-    QListWidget, QListWidgetItem, QPushButton, QLabel, QMessageBox,
-    QTableWidget, QHeaderView, QComboBox, QTabWidget, QWidget
+    QListView, QPushButton, QLabel, QMessageBox,
+    QTableWidget, QTableWidgetItem, QHeaderView, QComboBox, QTabWidget,
+    QWidget, QStyledItemDelegate
 )
 from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QStandardItemModel, QStandardItem
+
+
+class ElementComboDelegate(QStyledItemDelegate):
+    """Edits table cells through one shared element combo instead of a widget per cell."""
+
+    def __init__(self, elements, parent=None):
+        super().__init__(parent)
+        self.elements = elements
+
+    def createEditor(self, parent, option, index):
+        combo = QComboBox(parent)
+        combo.addItems(self.elements)
+        return combo
+
+    def setEditorData(self, editor, index):
+        i = editor.findText(index.data() or "")
+        if i >= 0:
+            editor.setCurrentIndex(i)
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.currentText())
 
 
 class NewLatticeDialog(QDialog):
@@ -57,8 +81,11 @@ class NewLatticeDialog(QDialog):
         layout.addWidget(self.gen_btn)
         
         layout.addWidget(QLabel("Relations (a ≤ b):"))
-        self.rel_list = QListWidget()
-        self.rel_list.itemChanged.connect(self.on_relation_changed)
+        self.rel_list = QListView()
+        self.rel_model = QStandardItemModel(self.rel_list)
+        self.rel_model.itemChanged.connect(self.on_relation_changed)
+        self.rel_list.setModel(self.rel_model)
+        self._rel_items = {}
         layout.addWidget(self.rel_list)
 
     def setup_imp_tab(self):
@@ -68,14 +95,20 @@ class NewLatticeDialog(QDialog):
         layout.addWidget(self.table_imp)
 
     def populate_lists(self):
-        elements = [e.strip() for e in self.elements_input.text().split(',') if e.strip()]
+        elements = [sys.intern(e.strip()) for e in self.elements_input.text().split(',') if e.strip()]
         if not elements: return
-        self.rel_list.clear()
+        self.rel_model.blockSignals(True)
+        self.rel_model.clear()
+        items = []
         for p in itertools.product(elements, repeat=2):
-            item = QListWidgetItem(f"({p[0]}, {p[1]})")
+            item = QStandardItem(f"({p[0]}, {p[1]})")
             item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
             item.setCheckState(Qt.CheckState.Checked if p[0] == p[1] else Qt.CheckState.Unchecked)
-            self.rel_list.addItem(item)
+            item.setData(p, Qt.ItemDataRole.UserRole)
+            items.append(item)
+        self.rel_model.appendColumn(items)
+        self._rel_items = {item.data(Qt.ItemDataRole.UserRole): item for item in items}
+        self.rel_model.blockSignals(False)
 
     def on_tab_changed(self, index):
         if index == 1: self.populate_imp_table()
@@ -89,34 +122,24 @@ class NewLatticeDialog(QDialog):
         self.table_imp.setVerticalHeaderLabels(elements)
         self.table_imp.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         
+        # One delegate edits every cell; values live in plain items.
+        self.table_imp.setItemDelegate(ElementComboDelegate(elements, self.table_imp))
+        default = elements[0] if elements else ""
         for r in range(n):
             for c in range(n):
-                combo = QComboBox()
-                combo.addItems(elements)
-                if elements[r] == elements[c]:
-                     pass 
-                self.table_imp.setCellWidget(r, c, combo)
+                self.table_imp.setItem(r, c, QTableWidgetItem(default))
     
-    def on_relation_changed(self, item: QListWidgetItem):
-        clean = item.text().replace('(', '').replace(')', '').replace("'", "")
-        a, b = [x.strip() for x in clean.split(',')]
+    def on_relation_changed(self, item: QStandardItem):
+        a, b = item.data(Qt.ItemDataRole.UserRole)
 
         if a == b:
             return
 
-        opposite = None
-        for i in range(self.rel_list.count()):
-            other = self.rel_list.item(i)
-            clean_other = other.text().replace('(', '').replace(')', '').replace("'", "")
-            x, y = [v.strip() for v in clean_other.split(',')]
-            if x == b and y == a:
-                opposite = other
-                break
-
+        opposite = self._rel_items.get((b, a))
         if opposite is None:
             return
 
-        self.rel_list.blockSignals(True)
+        self.rel_model.blockSignals(True)
 
         if item.checkState() == Qt.CheckState.Checked:
             opposite.setCheckState(Qt.CheckState.Unchecked)
@@ -125,7 +148,7 @@ class NewLatticeDialog(QDialog):
         elif item.checkState() == Qt.CheckState.Unchecked:
             opposite.setFlags(opposite.flags() | Qt.ItemFlag.ItemIsUserCheckable)
 
-        self.rel_list.blockSignals(False)
+        self.rel_model.blockSignals(False)
 
     def validate_and_accept(self):
         if not self.name_input.text().strip():
@@ -135,15 +158,12 @@ class NewLatticeDialog(QDialog):
 
     def get_data(self) -> Tuple[str, Set[str], Set[Tuple[str, str]], Dict[Tuple[str, str], str]]:
         name = self.name_input.text().strip()
-        elements = {e.strip() for e in self.elements_input.text().split(',') if e.strip()}
+        elements = {sys.intern(e.strip()) for e in self.elements_input.text().split(',') if e.strip()}
         
-        relations = set()
-        for i in range(self.rel_list.count()):
-            item = self.rel_list.item(i)
-            if item.checkState() == Qt.CheckState.Checked:
-                clean = item.text().replace('(', '').replace(')', '').replace("'", "")
-                p = [x.strip() for x in clean.split(',')]
-                relations.add((p[0], p[1]))
+        relations = {
+            pair for pair, item in self._rel_items.items()
+            if item.checkState() == Qt.CheckState.Checked
+        }
 
         imp_map = {}
         rows = self.table_imp.rowCount()
@@ -151,7 +171,7 @@ class NewLatticeDialog(QDialog):
             a = self.table_imp.verticalHeaderItem(r).text()
             for c in range(rows):
                 b = self.table_imp.horizontalHeaderItem(c).text()
-                res = self.table_imp.cellWidget(r, c).currentText()
+                res = self.table_imp.item(r, c).text()
                 imp_map[(a, b)] = res
                 
         return name, elements, relations, imp_map
\ No newline at end of file
@@ -2,14 +2,94 @@
 New Model Dialog Module.
 """
 
+import sys
 from collections import defaultdict
 from typing import List, Set, Dict, Tuple, Optional, Any
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QFormLayout, QLineEdit, QDialogButtonBox, 
     QComboBox, QListWidget, QAbstractItemView, QTabWidget, QWidget, 
-    QTableWidget, QLabel, QMessageBox, QHBoxLayout, QTextEdit
+    QTableView, QLabel, QMessageBox, QHBoxLayout, QTextEdit,
+    QStyledItemDelegate
 )
-from ast import literal_eval
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QEvent
+
+
+class RelationWeightDelegate(QStyledItemDelegate):
+    """Edits weight cells through one on-demand combo instead of a widget per cell."""
+
+    def __init__(self, dialog, parent=None):
+        super().__init__(parent)
+        self.dialog = dialog
+
+    def createEditor(self, parent, option, index):
+        combo = QComboBox(parent)
+        for display_text, user_data in self.dialog.ts_elements_data:
+            combo.addItem(display_text, user_data)
+        return combo
+
+    def setEditorData(self, editor, index):
+        idx = self.dialog.ts_element_index.get(index.data(Qt.ItemDataRole.UserRole), 0)
+        editor.setCurrentIndex(idx)
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.currentData(), Qt.ItemDataRole.EditRole)
+
+
+class RelationTableModel(QAbstractTableModel):
+    """
+    Table view over one action's weight map. Rows and columns are the
+    selected states; edits write straight into the dialog's relations_data,
+    so switching actions repoints the model instead of rebuilding N x N
+    combo widgets.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._worlds = []
+        self._weights = {}
+
+    def reset_view(self, worlds, weights) -> None:
+        self.beginResetModel()
+        self._worlds = list(worlds)
+        self._weights = weights
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._worlds)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._worlds)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and 0 <= section < len(self._worlds):
+            return self._worlds[section]
+        return None
+
+    def flags(self, index):
+        return (Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+                | Qt.ItemFlag.ItemIsEditable)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        value = self._weights.get(self._worlds[index.row()], {}).get(self._worlds[index.column()])
+        if value is None:
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return str(value).replace("'", "")
+        if role == Qt.ItemDataRole.UserRole:
+            return value
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.EditRole or not index.isValid() or not isinstance(value, tuple):
+            return False
+        src = self._worlds[index.row()]
+        tgt = self._worlds[index.column()]
+        self._weights[src][tgt] = value
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
+        return True
+
 
 class NewModelDialog(QDialog):
     def __init__(
@@ -27,14 +107,36 @@ class NewModelDialog(QDialog):
         self.worlds_dict = worlds_dict
         self.ts_names = sorted(list(twist_structures_dict.keys()))
         self.props = props
+
+        # TS name -> sorted state names, indexed once so switching the combo
+        # does not rescan every world.
+        self._worlds_by_ts: Dict[str, List[str]] = defaultdict(list)
+        for w_name, world_obj in worlds_dict.items():
+            self._worlds_by_ts[world_obj.twist_structure.name].append(w_name)
+        for names in self._worlds_by_ts.values():
+            names.sort()
         
         # Relations: { action: { source: {target: (t, f)} } }
-        self.relations_data: Dict[str, Dict[str, Dict[str, Tuple[str, str]]]] = defaultdict(lambda: defaultdict(dict))
+        self.relations_data: Dict[str, Dict[str, Dict[str, Tuple[str, str]]]] = {}
         
         self.current_action_context: Optional[str] = None
+        self._selected_worlds: List[str] = []
+        # TS whose states currently fill the list; re-picking it skips the refill.
+        self._current_filtered_ts: Optional[str] = None
+        # parse_actions memo: last raw input text and its parsed list.
+        self._actions_cache_text: Optional[str] = None
+        self._actions_cache_val: List[str] = []
+        # TS whose elements should back the weight combos, resolved lazily.
+        self._pending_ts_name: Optional[str] = None
         
-        # List of (Display String, User Data String)
-        self.ts_elements_data: List[Tuple[str, Optional[str]]] = []
+        # List of (Display String, element tuple) pairs for the weight combos,
+        # plus an element -> combo-index map so the delegate avoids findData.
+        self.ts_elements_data: List[Tuple[str, Any]] = []
+        self.ts_element_index: Dict[Any, int] = {}
+        # (elements list, index map, bottom element) per TS name; re-picking a
+        # structure in the combo reuses the computed list instead of
+        # re-toposorting.
+        self._ts_elements_cache: Dict[str, Tuple[List[Tuple[str, Any]], Dict[Any, int], Any]] = {}
         
         self.no_connection_str = "(No Connection)"
         
@@ -49,9 +151,10 @@ class NewModelDialog(QDialog):
         self.setup_general_tab()
         self.tabs.addTab(self.tab_general, "1. General & States")
 
-        # Tab 2
+        # Tab 2 — built lazily on first visit; opening the dialog only pays
+        # for the general tab.
         self.tab_relations = QWidget()
-        self.setup_relations_tab()
+        self._relations_built = False
         self.tabs.addTab(self.tab_relations, "2. Action Relations (Weights)")
 
         # Buttons
@@ -67,9 +170,12 @@ class NewModelDialog(QDialog):
         self.name_input = QLineEdit()
         self.name_input.setPlaceholderText("PLTS Name")
 
-        self.desc_input = QTextEdit()
-        self.desc_input.setPlaceholderText("Optional description of the model...")
-        self.desc_input.setMaximumHeight(1000)
+        # The QTextEdit (and its rich-text machinery) is only built when the
+        # user actually clicks to add a description.
+        self.desc_input: Optional[QTextEdit] = None
+        self._desc_placeholder = QLabel("Click to add a description...")
+        self._desc_placeholder.setStyleSheet("color: gray; font-style: italic;")
+        self._desc_placeholder.installEventFilter(self)
         
         self.combo_ts = QComboBox()
         self.combo_ts.addItems(self.ts_names)
@@ -80,10 +186,11 @@ class NewModelDialog(QDialog):
         self.actions_input.editingFinished.connect(self.parse_actions)
 
         form.addRow("Name:", self.name_input)
-        form.addRow("Description:", self.desc_input)
+        form.addRow("Description:", self._desc_placeholder)
         form.addRow("Twist Structure:", self.combo_ts)
         form.addRow("Actions:", self.actions_input)
         layout.addLayout(form)
+        self._general_form = form
 
         layout.addWidget(QLabel("Select States (Filtered by Twist Structure):"))
         self.list_worlds = QListWidget()
@@ -93,6 +200,22 @@ class NewModelDialog(QDialog):
         
         if self.ts_names: self.on_ts_changed(0)
 
+    def eventFilter(self, obj, event):
+        if obj is self._desc_placeholder and event.type() == QEvent.Type.MouseButtonPress:
+            self._build_desc_input()
+            return True
+        return super().eventFilter(obj, event)
+
+    def _build_desc_input(self) -> None:
+        """Swap the placeholder label for the real description editor."""
+        self.desc_input = QTextEdit()
+        self.desc_input.setPlaceholderText("Optional description of the model...")
+        self.desc_input.setMaximumHeight(1000)
+        self._general_form.replaceWidget(self._desc_placeholder, self.desc_input)
+        self._desc_placeholder.hide()
+        self._desc_placeholder.deleteLater()
+        self.desc_input.setFocus()
+
     def setup_relations_tab(self) -> None:
         layout = QVBoxLayout(self.tab_relations)
         
@@ -104,51 +227,74 @@ class NewModelDialog(QDialog):
         layout.addLayout(action_layout)
         
         layout.addWidget(QLabel("Assign weights (Row → Col)."))
-        self.table_relations = QTableWidget()
+        self.table_relations = QTableView()
+        self.relations_model = RelationTableModel(self.table_relations)
+        self.table_relations.setModel(self.relations_model)
+        self.table_relations.setItemDelegate(RelationWeightDelegate(self, self.table_relations))
         layout.addWidget(self.table_relations)
 
     # Logic
     def on_ts_changed(self, index: int):
         name = self.combo_ts.currentText()
+        # Element lists are only needed on the relations tab; just remember
+        # which structure to build them for.
+        self._pending_ts_name = name
+        self.filter_worlds_by_ts(name)
 
-        if name in self.twist_structures:
+    def _ensure_ts_elements(self) -> None:
+        """Populate the element list for the pending TS, building it on first use."""
+        name = self._pending_ts_name
+        if name not in self.twist_structures:
+            return
+        cached = self._ts_elements_cache.get(name)
+        if cached is None:
             ts = self.twist_structures[name]
-
             sorted_elems = ts.toposort_twist_elements()
-
-            bottom_elem = sorted_elems[0]
-
-            self.ts_elements_data = []
-            self.ts_bottom = bottom_elem
-
+            elements_data = []
             for e in sorted_elems:
-                real_str = str(e)
-                display_str = real_str.replace("'", "")
-                self.ts_elements_data.append((display_str, real_str))
+                display_str = str(e).replace("'", "")
+                elements_data.append((display_str, e))
+            element_index = {e: i for i, (_, e) in enumerate(elements_data)}
+            cached = (elements_data, element_index, sorted_elems[0])
+            self._ts_elements_cache[name] = cached
 
-        self.filter_worlds_by_ts(name)
+        self.ts_elements_data, self.ts_element_index, self.ts_bottom = cached
 
     def filter_worlds_by_ts(self, ts_name: str) -> None:
         """Only show worlds that are associated with the selected Twist Structure."""
-        self.list_worlds.clear()
-        
-        compatible_worlds = []
-        for w_name, world_obj in self.worlds_dict.items():
-            if world_obj.twist_structure.name == ts_name:
-                compatible_worlds.append(w_name)
-        
-        self.list_worlds.addItems(sorted(compatible_worlds))
+        if ts_name == self._current_filtered_ts:
+            return
+        compatible_worlds = self._worlds_by_ts.get(ts_name, [])
+
+        # Repaint once for the whole refill instead of per item.
+        self.list_worlds.setUpdatesEnabled(False)
+        self.list_worlds.blockSignals(True)
+        try:
+            self.list_worlds.clear()
+            self.list_worlds.addItems(compatible_worlds)
+        finally:
+            self.list_worlds.blockSignals(False)
+            self.list_worlds.setUpdatesEnabled(True)
         
+        self._current_filtered_ts = ts_name
         if not compatible_worlds and self.worlds_dict:
             self.list_worlds.setToolTip("No states found for this Twist Structure.")
         else:
             self.list_worlds.setToolTip("")
 
     def parse_actions(self) -> List[str]:
-        return [x.strip() for x in self.actions_input.text().split(',') if x.strip()]
+        txt = self.actions_input.text()
+        if txt != self._actions_cache_text:
+            self._actions_cache_val = [x.strip() for x in txt.split(',') if x.strip()]
+            self._actions_cache_text = txt
+        return self._actions_cache_val
 
     def on_tab_changed(self, index: int) -> None:
-        if index == 1: self.prepare_relations_tab()
+        if index == 1:
+            if not self._relations_built:
+                self.setup_relations_tab()
+                self._relations_built = True
+            self.prepare_relations_tab()
 
     def prepare_relations_tab(self) -> None:
         actions = self.parse_actions()
@@ -164,77 +310,26 @@ class NewModelDialog(QDialog):
         if curr in actions: self.combo_current_action.setCurrentText(curr)
         self.combo_current_action.blockSignals(False)
 
-        selected_worlds = [item.text() for item in self.list_worlds.selectedItems()]
-        n = len(selected_worlds)
-        self.table_relations.setRowCount(n)
-        self.table_relations.setColumnCount(n)
-        self.table_relations.setHorizontalHeaderLabels(selected_worlds)
-        self.table_relations.setVerticalHeaderLabels(selected_worlds)
+        self._ensure_ts_elements()
+        # Interned so every weight-map lookup keyed on these names compares
+        # by pointer first.
+        self._selected_worlds = [sys.intern(item.text()) for item in self.list_worlds.selectedItems()]
         
         if self.combo_current_action.count() > 0:
             self.switch_action_context(self.combo_current_action.currentText())
 
     def switch_action_context(self, new_action: str) -> None:
         if not new_action: return
-        if self.current_action_context:
-            self.save_current_table_to_data(self.current_action_context)
         self.current_action_context = new_action
-        self.load_data_to_table(new_action)
-
-    def save_current_table_to_data(self, action: str) -> None:
-        rows = self.table_relations.rowCount()
-        cols = self.table_relations.columnCount()
-        
-        if action not in self.relations_data:
-            self.relations_data[action] = defaultdict(dict)
-            
-        for r in range(rows):
-            src = self.table_relations.verticalHeaderItem(r).text()
-            for c in range(cols):
-                tgt = self.table_relations.horizontalHeaderItem(c).text()
-                combo = self.table_relations.cellWidget(r, c)
-                
-                if isinstance(combo, QComboBox):
-                    val_data = combo.currentData()
-                    if val_data is None:
-                        if tgt in self.relations_data[action][src]:
-                            del self.relations_data[action][src][tgt]
-                    else:
-                        try:
-                            val_tuple = literal_eval(val_data)
-                            self.relations_data[action][src][tgt] = val_tuple
-                        except: pass
-
-    def load_data_to_table(self, action: str) -> None:
-        rows = self.table_relations.rowCount()
-        cols = self.table_relations.columnCount()
-        data = self.relations_data.get(action, {})
-        
-        for r in range(rows):
-            src = self.table_relations.verticalHeaderItem(r).text()
-            row_data = data.get(src, {})
-            
-            for c in range(cols):
-                tgt = self.table_relations.horizontalHeaderItem(c).text()
-                
-                combo = QComboBox()
-                for display_text, user_data in self.ts_elements_data:
-                    combo.addItem(display_text, user_data)
-                
-                saved_val = row_data.get(tgt, None)
-
-                if saved_val is None:
-                    idx = combo.findData(str(self.ts_bottom))
-                    combo.setCurrentIndex(idx if idx >= 0 else 0)
-                else:
-                    saved_str = str(saved_val)
-                    idx = combo.findData(saved_str)
-                    if idx >= 0:
-                        combo.setCurrentIndex(idx)
-                    else:
-                        combo.setCurrentIndex(0)
-                
-                self.table_relations.setCellWidget(r, c, combo)
+        weights = self.relations_data.setdefault(new_action, {})
+        # Unset pairs default to the bottom weight, matching what the old
+        # per-cell combos recorded when the table was saved.
+        for src_name in self._selected_worlds:
+            src_map = weights.setdefault(src_name, {})
+            for tgt in self._selected_worlds:
+                if tgt not in src_map:
+                    src_map[tgt] = self.ts_bottom
+        self.relations_model.reset_view(self._selected_worlds, weights)
 
     def validate_and_accept(self) -> None:
         if not self.name_input.text().strip():
@@ -250,18 +345,28 @@ class NewModelDialog(QDialog):
             QMessageBox.warning(self, "Error", "Define actions.")
             return
         
-        if self.current_action_context:
-            self.save_current_table_to_data(self.current_action_context)
         self.accept()
 
     def get_data(self) -> Tuple[str, str, List[str], str, Set[str], Dict, str]:
         name = self.name_input.text().strip()
-        description = self.desc_input.toPlainText().strip()
+        description = self.desc_input.toPlainText().strip() if self.desc_input is not None else ""
         ts_name = self.combo_ts.currentText()
         selected_items = self.list_worlds.selectedItems()
         world_names = [item.text() for item in selected_items]
-        
-        if self.current_action_context:
-            self.save_current_table_to_data(self.current_action_context)
 
-        return name, ts_name, world_names, self.props, self.relations_data, description
\ No newline at end of file
+        # Bottom weights are the "no connection" value the table seeds for
+        # unset pairs; dropping them (and any sub-dicts left empty) keeps the
+        # created model free of padding, since a missing transition already
+        # means bottom downstream.
+        bottom = getattr(self, "ts_bottom", None)
+        relations = {}
+        for action, src_map in self.relations_data.items():
+            action_map = {}
+            for src, tgt_map in src_map.items():
+                pruned = {tgt: w for tgt, w in tgt_map.items() if w != bottom}
+                if pruned:
+                    action_map[src] = pruned
+            if action_map:
+                relations[action] = action_map
+
+        return name, ts_name, world_names, self.props, relations, description
\ No newline at end of file
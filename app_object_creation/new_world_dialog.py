@@ -8,6 +8,7 @@ from PyQt6.QtWidgets import (
     QGroupBox, QVBoxLayout, QWidget, QMessageBox, QLabel, QScrollArea, QListWidget, QPushButton, QSplitter
 )
 from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QStandardItemModel, QStandardItem
 
 class NewWorldDialog(QDialog):
     def __init__(
@@ -23,9 +24,16 @@ class NewWorldDialog(QDialog):
         self.twist_structures = twist_structures
         self.props = sorted(list(props))
         self.assignment_widgets: Dict[str, QComboBox] = {}
+        # TS whose elements currently fill the valuation combos.
+        self._last_ts_name: Optional[str] = None
+        # Per-TS (display list, data list, display -> row) built once each.
+        self._elem_display_cache: Dict[str, Tuple[List[str], List[str], Dict[str, int]]] = {}
         
         # List of tuples: (long_name, short_name, ts_name, assignments_dict)
         self.queue_data: List[Tuple[str, str, str, Dict[str, str]]] = []
+        # Names already queued, for O(1) duplicate checks on Add.
+        self._queue_long_names: Set[str] = set()
+        self._queue_short_names: Set[str] = set()
         
         # Main Layout (Splitter)
         main_layout = QVBoxLayout(self)
@@ -53,7 +61,9 @@ class NewWorldDialog(QDialog):
         if self.twist_structures:
             self.combo_ts.addItems(sorted(list(self.twist_structures.keys())))
         
-        self.combo_ts.currentTextChanged.connect(self.update_assignment_options)
+        # activated fires only on a committed user choice, unlike
+        # currentTextChanged, which also fires for programmatic changes.
+        self.combo_ts.activated.connect(self._on_ts_activated)
         
         form_layout.addRow("Long Name:", self.long_name_input)
         form_layout.addRow("Short Name:", self.short_name_input)
@@ -71,8 +81,12 @@ class NewWorldDialog(QDialog):
         if not self.props:
             self.assignments_layout.addRow(QWidget(), QLabel("No propositions defined."))
         else:
+            # Every combo shows the same element list, so they all view one
+            # shared item model instead of holding a private copy each.
+            self._shared_assign_model = QStandardItemModel(self)
             for p in self.props:
                 combo = QComboBox()
+                combo.setModel(self._shared_assign_model)
                 self.assignment_widgets[p] = combo
                 self.assignments_layout.addRow(f"Value for '{p}':", combo)
             
@@ -101,6 +115,7 @@ class NewWorldDialog(QDialog):
         
         right_layout.addWidget(QLabel("<b>States to Create:</b>"))
         self.list_queue = QListWidget()
+        self.list_queue.setUniformItemSizes(True)
         right_layout.addWidget(self.list_queue)
         
         btn_remove = QPushButton("Remove Selected")
@@ -118,30 +133,48 @@ class NewWorldDialog(QDialog):
         buttons.rejected.connect(self.reject)
         main_layout.addWidget(buttons)
 
+    def _on_ts_activated(self, index: int) -> None:
+        self.update_assignment_options(self.combo_ts.currentText())
+
     def update_assignment_options(self, ts_name: str) -> None:
         """Populates value dropdowns with elements from selected Twist Structure."""
+        if ts_name == self._last_ts_name: return
         if ts_name not in self.twist_structures: return
 
-        ts = self.twist_structures[ts_name]
-        sorted_elems = ts.toposort_twist_elements()
-        
+        if not self.assignment_widgets:
+            return
+
+        cached = self._elem_display_cache.get(ts_name)
+        if cached is None:
+            ts = self.twist_structures[ts_name]
+            data_list = [str(e) for e in ts.toposort_twist_elements()]
+            display_list = [s.replace("'", "") for s in data_list]  # Clean for user
+            display_index = {s: i for i, s in enumerate(display_list)}
+            cached = (display_list, data_list, display_index)
+            self._elem_display_cache[ts_name] = cached
+        # One batch fill of the shared model updates every combo at once.
+        display_list, data_list, display_index = cached
+
+        prev_texts = {p: combo.currentText() for p, combo in self.assignment_widgets.items()}
+
         for combo in self.assignment_widgets.values():
-            prev_text = combo.currentText()
-            
             combo.blockSignals(True)
-            combo.clear()
-            
-            for e in sorted_elems:
-                real_str = str(e)
-                display_str = real_str.replace("'", "") # Clean for user
-                combo.addItem(display_str, real_str)   # Add (Text, Data)
-            
-            # Restore previous selection if possible (matching display text)
-            idx = combo.findText(prev_text)
-            if idx >= 0:
-                combo.setCurrentIndex(idx)
-                
-            combo.blockSignals(False)
+        try:
+            self._shared_assign_model.clear()
+            items = []
+            for display_str, real_str in zip(display_list, data_list):
+                item = QStandardItem(display_str)
+                item.setData(real_str, Qt.ItemDataRole.UserRole)
+                items.append(item)
+            self._shared_assign_model.appendColumn(items)
+
+            # Restore previous selections if possible (matching display text)
+            for p, combo in self.assignment_widgets.items():
+                combo.setCurrentIndex(display_index.get(prev_texts[p], 0))
+        finally:
+            for combo in self.assignment_widgets.values():
+                combo.blockSignals(False)
+        self._last_ts_name = ts_name
 
     def add_to_queue(self) -> None:
         """Validates current input and adds it to the right-hand list."""
@@ -169,13 +202,12 @@ class NewWorldDialog(QDialog):
         
         
         # Check duplicates in queue
-        for item in self.queue_data:
-            if item[0] == l_name:
-                QMessageBox.warning(self, "Error", f"Long Name '{l_name}' already in queue.")
-                return
-            if item[1] == s_name:
-                QMessageBox.warning(self, "Error", f"Short Name '{s_name}' already in queue.")
-                return
+        if l_name in self._queue_long_names:
+            QMessageBox.warning(self, "Error", f"Long Name '{l_name}' already in queue.")
+            return
+        if s_name in self._queue_short_names:
+            QMessageBox.warning(self, "Error", f"Short Name '{s_name}' already in queue.")
+            return
 
         # Gather assignments using the stored DATA
         assignments = {}
@@ -188,6 +220,8 @@ class NewWorldDialog(QDialog):
             
         # Store Data
         self.queue_data.append((l_name, s_name, ts_name, assignments))
+        self._queue_long_names.add(l_name)
+        self._queue_short_names.add(s_name)
         
         # Update UI
         display_str = f"{s_name} ({l_name}) - [{ts_name}]"
@@ -200,11 +234,31 @@ class NewWorldDialog(QDialog):
             if combo.count() > 0:
                 combo.setCurrentIndex(0)
 
+    def add_many_to_queue(self, entries: List[Tuple[str, str, str, Dict[str, str]]]) -> None:
+        """
+        Appends several pre-validated (long, short, ts, assignments) entries
+        with one list repaint instead of one per item.
+        """
+        if not entries:
+            return
+        self.list_queue.setUpdatesEnabled(False)
+        try:
+            self.list_queue.addItems(
+                f"{s_name} ({l_name}) - [{ts_name}]" for l_name, s_name, ts_name, _ in entries
+            )
+            self.queue_data.extend(entries)
+            self._queue_long_names.update(e[0] for e in entries)
+            self._queue_short_names.update(e[1] for e in entries)
+        finally:
+            self.list_queue.setUpdatesEnabled(True)
+
     def remove_from_queue(self) -> None:
         row = self.list_queue.currentRow()
         if row >= 0:
             self.list_queue.takeItem(row)
-            self.queue_data.pop(row)
+            l_name, s_name, _, _ = self.queue_data.pop(row)
+            self._queue_long_names.discard(l_name)
+            self._queue_short_names.discard(s_name)
 
     def validate_final(self) -> None:
         """Called when pressing OK."""
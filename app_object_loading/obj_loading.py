@@ -51,7 +51,16 @@ class MultiSelectDialog(QDialog):
         # List Widget Configuration
         self.list_widget = QListWidget()
         self.list_widget.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
-        self.list_widget.addItems(items)
+        # Uniform row heights let Qt skip per-row size hints, and the
+        # update/signal guards keep the bulk insert to a single repaint.
+        self.list_widget.setUniformItemSizes(True)
+        self.list_widget.setUpdatesEnabled(False)
+        self.list_widget.blockSignals(True)
+        try:
+            self.list_widget.addItems(items)
+        finally:
+            self.list_widget.blockSignals(False)
+            self.list_widget.setUpdatesEnabled(True)
         layout.addWidget(self.list_widget)
 
         # Dialog Buttons (OK / Cancel)
@@ -5,11 +5,19 @@ Handles persistence of Lattices, Residuated Lattices, Twist Structures, Worlds a
 """
 
 import json
-import re
 import os
+import sys
+import tempfile
 from ast import literal_eval
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 
+# Optional fast JSON parser; the stdlib module is the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from math_objects.lattice import Lattice, ResiduatedLattice, TwistStructure
 from math_objects.world import World
 from math_objects.model import Model
@@ -17,29 +25,152 @@ from math_objects.model import Model
 
 class JSONHandler:
 
+    # Manifest keys and the field naming their entries. Manifests are stored
+    # as name -> entry dicts; legacy files with entry lists are migrated on
+    # load so a single save or delete never rescans the whole collection.
+    _MANIFEST_NAME_KEYS = {
+        "lattices": "name",
+        "residuated_lattices": "name_residuated_lattice",
+        "twist_structures": "name",
+        "worlds": "world_name",
+        "models": "model_name",
+    }
+
+    @staticmethod
+    def _migrate_list_to_dict(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Converts legacy list-shaped manifest sections to name-keyed dicts."""
+        for key, name_key in JSONHandler._MANIFEST_NAME_KEYS.items():
+            section = data.get(key)
+            if isinstance(section, list):
+                data[key] = {e[name_key]: e for e in section if name_key in e}
+        return data
+
     @staticmethod
     def _load_safe(filename: str) -> Dict[str, Any]:
         """Safely loads JSON data from a file."""
-        if not os.path.exists(filename) or os.path.getsize(filename) == 0:
+        try:
+            with open(filename, 'rb') as f:
+                raw = f.read()
+        except OSError:
+            return {}
+        if not raw:
             return {}
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         except Exception as e:
             print(f"Warning: Failed to load {filename}: {e}")
             return {}
+        return JSONHandler._migrate_list_to_dict(data)
+
+    @staticmethod
+    def _write_manifest(filename: str, data: Dict[str, Any]) -> None:
+        """
+        Writes a manifest atomically: the compacted JSON goes to a temp file
+        in the same directory, which then replaces the target, so a crash
+        mid-write can never leave a half-written store behind.
+        """
+        dirname = os.path.dirname(filename) or "."
+        with tempfile.NamedTemporaryFile('w', dir=dirname, suffix='.tmp', delete=False) as tf:
+            JSONHandler._emit_compact(data, 0, tf.write)
+            tmp = tf.name
+        os.replace(tmp, filename)
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _parse_cached(filename: str, mtime_ns: int) -> Dict[str, Any]:
+        """
+        _load_safe memoized on (path, mtime): repeated reads of an unchanged
+        file (menu opens, dependency chains) return the already-parsed dict.
+        Saving rewrites the file and bumps its mtime, which invalidates the
+        cached entry automatically. Callers must not mutate the result.
+        """
+        return JSONHandler._load_safe(filename)
+
+    @staticmethod
+    def _entry_index(filename: str, json_key: str, name_key: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Name -> entry mapping for one manifest, cached on file mtime.
+
+        Lets loaders look a named entry up in O(1) instead of scanning the
+        manifest list on every call; dependency chains (Model -> Worlds ->
+        Twist Structures -> Lattices) hit the same parsed index repeatedly.
+        """
+        try:
+            mtime_ns = os.stat(filename).st_mtime_ns
+        except OSError:
+            return {}
+        return JSONHandler._index_cached(filename, json_key, name_key, mtime_ns)
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _index_cached(filename: str, json_key: str, name_key: str, mtime_ns: int) -> Dict[str, Dict[str, Any]]:
+        data = JSONHandler._parse_cached(filename, mtime_ns)
+        return data.get(json_key, {})
+
+    @staticmethod
+    def _parse_tuple_key(s: str):
+        """
+        Parses an implication-map key like "('a', 'b')" without the AST
+        round-trip literal_eval pays; the saver only ever emits this exact
+        shape. Malformed keys fall back to literal_eval.
+        """
+        a, sep, b = s.strip("() ").partition(",")
+        if sep:
+            return a.strip().strip("'\""), b.strip().strip("'\"")
+        return literal_eval(s)
+
+    _COMPACT_LEAF_TYPES = (str, int, float, bool, type(None))
 
     @staticmethod
-    def _compact_json(data: Dict[str, Any]) -> str:
-        """Formats JSON to keep lists and relation tuples on one line for readability."""
-        json_str = json.dumps(data, indent=4)
-        # Compact simple lists [ "a", "b" ]
-        json_str = re.sub(r'\[\s+("[^"]+",?)\s+\]', r'[\1]', json_str)
-        # Compact tuples [ "a", "b" ]
-        json_str = re.sub(r'\[\s+("[^"]+",)\s+("[^"]+")\s+\]', r'[\1 \2]', json_str)
-        # Compact nested lists/tuples often used in relations
-        json_str = re.sub(r'\[\s+((?:\["[^"]+",\s*"[^"]+"\](?:,\s*)?)+)\s+\]', lambda m: f"[{m.group(1)}]", json_str)
-        return json_str
+    def _is_compact_list(obj: list) -> bool:
+        """A list that stays on one line: all primitives, or all pairs of primitives."""
+        leaf = JSONHandler._COMPACT_LEAF_TYPES
+        for item in obj:
+            if isinstance(item, leaf):
+                continue
+            if (isinstance(item, list) and len(item) <= 2
+                    and all(isinstance(x, leaf) for x in item)):
+                continue
+            return False
+        return True
+
+    @staticmethod
+    def _emit_compact(obj: Any, indent: int, write) -> None:
+        """
+        Writes JSON with 4-space indentation, keeping element lists and
+        relation tuples on one line for readability. Streams straight to the
+        write callable, replacing the old regex passes over a full dumps
+        string and the second text copy they implied.
+        """
+        pad = " " * indent
+        if isinstance(obj, dict):
+            if not obj:
+                write("{}")
+                return
+            write("{\n")
+            inner = pad + "    "
+            last = len(obj) - 1
+            for i, (key, val) in enumerate(obj.items()):
+                write(f"{inner}{json.dumps(key)}: ")
+                JSONHandler._emit_compact(val, indent + 4, write)
+                write(",\n" if i < last else "\n")
+            write(pad + "}")
+        elif isinstance(obj, list):
+            if not obj:
+                write("[]")
+            elif JSONHandler._is_compact_list(obj):
+                write(json.dumps(obj))
+            else:
+                write("[\n")
+                inner = pad + "    "
+                last = len(obj) - 1
+                for i, item in enumerate(obj):
+                    write(inner)
+                    JSONHandler._emit_compact(item, indent + 4, write)
+                    write(",\n" if i < last else "\n")
+                write(pad + "]")
+        else:
+            write(json.dumps(obj))
 
     # ==========================================
     #               CONFIGURATION
@@ -68,61 +199,78 @@ class JSONHandler:
 
     @staticmethod
     def load_lattice_from_json(filename: str, lattice_name: str) -> Optional[Lattice]:
-        data = JSONHandler._load_safe(filename)
-        if 'lattices' in data:
-            for l_data in data['lattices']:
-                if l_data.get('name') == lattice_name:
+        l_data = JSONHandler._entry_index(filename, 'lattices', 'name').get(lattice_name)
+        if l_data is not None:
+            try:
+                # Interned names hash and compare by pointer in the many
+                # dicts and sets keyed by them downstream; the pair cache
+                # likewise shares one tuple object between the relation set
+                # and the implication-map keys naming the same pair.
+                pair_cache = {}
+
+                def _pair(a, b):
+                    key = (sys.intern(a), sys.intern(b))
+                    return pair_cache.setdefault(key, key)
+
+                elements = {sys.intern(e) for e in l_data.get('elements', [])}
+                relations = {_pair(a, b) for a, b in l_data.get('relations', [])}
+
+                raw_imp = l_data.get('implication_map', {})
+                implication_map = {}
+                for key_str, val in raw_imp.items():
                     try:
-                        elements = set(l_data.get('elements', []))
-                        relations = set(tuple(r) for r in l_data.get('relations', []))
-                        
-                        raw_imp = l_data.get('implication_map', {})
-                        implication_map = {}
-                        for key_str, val in raw_imp.items():
-                            try:
-                                # Convert string key "(a, b)" back to tuple
-                                key_tuple = literal_eval(key_str)
-                                implication_map[key_tuple] = val
-                            except: pass
-                            
-                        return Lattice(lattice_name, elements, relations, implication_map)
-                    except Exception as e:
-                        print(f"Error parsing lattice {lattice_name}: {e}")
+                        # Convert string key "(a, b)" back to tuple
+                        a, b = JSONHandler._parse_tuple_key(key_str)
+                        implication_map[_pair(a, b)] = sys.intern(val)
+                    except: pass
+
+                return Lattice.from_trusted_data(lattice_name, elements, relations, implication_map)
+            except Exception as e:
+                print(f"Error parsing lattice {lattice_name}: {e}")
         return None
 
     @staticmethod
     def save_lattice_to_json(filename: str, new_lattice: Lattice) -> bool:
         try:
             data = JSONHandler._load_safe(filename)
-            if 'lattices' not in data: data['lattices'] = []
-            
-            # Remove existing entry if overwriting
-            l_list = [l for l in data['lattices'] if l.get('name') != new_lattice.name]
-            
+
             # Serialize implication map keys to strings
             imp_map_str = {str(k): v for k, v in new_lattice.implication_map.items()}
-            
-            l_dict = {
+
+            data.setdefault('lattices', {})[new_lattice.name] = {
                 "name": new_lattice.name,
                 "elements": list(new_lattice.elements),
                 "relations": [list(r) for r in new_lattice.relations],
                 "implication_map": imp_map_str
             }
-            l_list.append(l_dict)
-            data['lattices'] = l_list
-            
-            with open(filename, 'w') as f: f.write(JSONHandler._compact_json(data))
+
+            JSONHandler._write_manifest(filename, data)
             return True
         except Exception as e:
             print(f"Error saving lattice: {e}")
             return False
 
+    @staticmethod
+    def delete_entries_from_json(filename: str, json_key: str, name_key: str, names) -> None:
+        """
+        Removes a batch of named entries from a manifest with a single
+        read-modify-write instead of one full-file rewrite per name.
+        """
+        names = list(names)
+        if not names:
+            return
+        data = JSONHandler._load_safe(filename)
+        section = data.get(json_key)
+        if section:
+            for name in names:
+                section.pop(name, None)
+            JSONHandler._write_manifest(filename, data)
+
     @staticmethod
     def delete_lattice_from_json(filename: str, lattice_name: str) -> None:
         data = JSONHandler._load_safe(filename)
-        if 'lattices' in data:
-            data['lattices'] = [l for l in data['lattices'] if l.get('name') != lattice_name]
-            with open(filename, 'w') as f: f.write(JSONHandler._compact_json(data))
+        if data.get('lattices', {}).pop(lattice_name, None) is not None:
+            JSONHandler._write_manifest(filename, data)
 
     # ==========================================
     #           RESIDUATED LATTICE
@@ -130,39 +278,31 @@ class JSONHandler:
 
     @staticmethod
     def load_residuated_lattice_from_json(filename: str, rl_name: str, lattices_file="json_files/lattices.json") -> Optional[ResiduatedLattice]:
-        data = JSONHandler._load_safe(filename)
-        if 'residuated_lattices' in data:
-            for rl in data['residuated_lattices']:
-                if rl.get('name_residuated_lattice') == rl_name:
-                    # Load base lattice to get structure
-                    base = JSONHandler.load_lattice_from_json(lattices_file, rl.get('name_lattice'))
-                    if base: 
-                        return ResiduatedLattice(rl_name, base.name, base.elements, base.relations, base.implication_map)
+        rl = JSONHandler._entry_index(filename, 'residuated_lattices', 'name_residuated_lattice').get(rl_name)
+        if rl is not None:
+            # Load base lattice to get structure
+            base = JSONHandler.load_lattice_from_json(lattices_file, rl.get('name_lattice'))
+            if base: 
+                return ResiduatedLattice.from_trusted_data(rl_name, base.name, base.elements, base.relations, base.implication_map)
         return None
 
     @staticmethod
     def save_residuated_lattice_to_json(filename: str, new_rl: ResiduatedLattice) -> bool:
         try:
             data = JSONHandler._load_safe(filename)
-            if 'residuated_lattices' not in data: data['residuated_lattices'] = []
-            
-            l = [x for x in data['residuated_lattices'] if x.get('name_residuated_lattice') != new_rl.name_residuated_lattice]
-            l.append({
-                "name_residuated_lattice": new_rl.name_residuated_lattice, 
+            data.setdefault('residuated_lattices', {})[new_rl.name_residuated_lattice] = {
+                "name_residuated_lattice": new_rl.name_residuated_lattice,
                 "name_lattice": new_rl.name
-            })
-            data['residuated_lattices'] = l
-            
-            with open(filename, 'w') as f: f.write(JSONHandler._compact_json(data))
+            }
+            JSONHandler._write_manifest(filename, data)
             return True
         except: return False
 
     @staticmethod
     def delete_residuated_lattice_from_json(filename: str, rl_name: str) -> None:
         data = JSONHandler._load_safe(filename)
-        if 'residuated_lattices' in data:
-            data['residuated_lattices'] = [x for x in data['residuated_lattices'] if x.get('name_residuated_lattice') != rl_name]
-            with open(filename, 'w') as f: f.write(JSONHandler._compact_json(data))
+        if data.get('residuated_lattices', {}).pop(rl_name, None) is not None:
+            JSONHandler._write_manifest(filename, data)
 
     # ==========================================
     #             TWIST STRUCTURE
@@ -170,104 +310,134 @@ class JSONHandler:
 
     @staticmethod
     def load_twist_structure_from_json(filename: str, ts_name: str, rl_file="json_files/residuated_lattices.json") -> Optional[TwistStructure]:
-        data = JSONHandler._load_safe(filename)
-        if 'twist_structures' in data:
-            for ts_data in data['twist_structures']:
-                if ts_data.get('name') == ts_name:
-                    # Load base RL
-                    rl = JSONHandler.load_residuated_lattice_from_json(rl_file, ts_data.get('residuated_lattice_name'))
-                    if rl:
-                        ts = TwistStructure(rl)
-                        ts.name = ts_name
-                        # Load pre-calculated elements/relations if present (optional but faster)
-                        if 'elements' in ts_data: 
-                            ts.elements = {tuple(e) for e in ts_data['elements']}
-                        if 'truth_relation' in ts_data: 
-                            ts.truth_relation = {tuple(map(tuple, r)) for r in ts_data['truth_relation']}
-                        if 'qntt_info_relation' in ts_data: 
-                            ts.qntt_info_relation = {tuple(map(tuple, r)) for r in ts_data['qntt_info_relation']}
-                        return ts
+        ts_data = JSONHandler._entry_index(filename, 'twist_structures', 'name').get(ts_name)
+        if ts_data is not None:
+            # Load base RL
+            rl = JSONHandler.load_residuated_lattice_from_json(rl_file, ts_data.get('residuated_lattice_name'))
+            if rl:
+                # Reuse pre-calculated elements/relations when present instead
+                # of deriving them again in TwistStructure.__init__. Each
+                # element pair appears once per relation row on disk, so the
+                # cache collapses them to one interned tuple object shared by
+                # the element set and both relations.
+                pair_cache = {}
+
+                def _pair(e):
+                    key = (sys.intern(e[0]), sys.intern(e[1]))
+                    return pair_cache.setdefault(key, key)
+
+                elements = {_pair(e) for e in ts_data['elements']} if 'elements' in ts_data else None
+                truth_rel = {(_pair(a), _pair(b)) for a, b in ts_data['truth_relation']} if 'truth_relation' in ts_data else None
+                info_rel = {(_pair(a), _pair(b)) for a, b in ts_data['qntt_info_relation']} if 'qntt_info_relation' in ts_data else None
+                return TwistStructure.from_trusted_data(rl, ts_name, elements, truth_rel, info_rel)
         return None
 
     @staticmethod
-    def save_twist_structure_to_json(filename: str, new_ts: TwistStructure, name: str) -> bool:
+    def save_twist_structure_to_json(filename: str, new_ts: TwistStructure, name: str, sort_output: bool = True) -> bool:
+        """
+        Persists a twist structure. sort_output keeps the emitted lists in a
+        deterministic, diff-friendly order; pass False for bulk saves where
+        the O(n log n) cosmetic sorts are not worth it.
+        """
         try:
             data = JSONHandler._load_safe(filename)
-            if 'twist_structures' not in data: data['twist_structures'] = []
-            
-            l = [x for x in data['twist_structures'] if x.get('name') != name]
-            
-            elements_list = [list(e) for e in sorted(list(new_ts.elements))]
-            truth_rel_list = [[list(a), list(b)] for a, b in sorted(list(new_ts.truth_relation))]
-            info_rel_list = [[list(a), list(b)] for a, b in sorted(list(new_ts.qntt_info_relation))]
 
-            l.append({
-                "name": name, 
+            order = sorted if sort_output else list
+            elements_list = [list(e) for e in order(new_ts.elements)]
+            truth_rel_list = [[list(a), list(b)] for a, b in order(new_ts.truth_relation)]
+            info_rel_list = [[list(a), list(b)] for a, b in order(new_ts.qntt_info_relation)]
+
+            data.setdefault('twist_structures', {})[name] = {
+                "name": name,
                 "residuated_lattice_name": new_ts.residuated_lattice.name_residuated_lattice,
                 "elements": elements_list,
                 "truth_relation": truth_rel_list,
                 "qntt_info_relation": info_rel_list
-            })
-            data['twist_structures'] = l
-            
-            with open(filename, 'w') as f: f.write(JSONHandler._compact_json(data))
+            }
+
+            JSONHandler._write_manifest(filename, data)
             return True
         except: return False
 
     @staticmethod
     def delete_twist_structure_from_json(filename: str, ts_name: str) -> None:
         data = JSONHandler._load_safe(filename)
-        if 'twist_structures' in data:
-            data['twist_structures'] = [x for x in data['twist_structures'] if x.get('name') != ts_name]
-            with open(filename, 'w') as f: f.write(JSONHandler._compact_json(data))
+        if data.get('twist_structures', {}).pop(ts_name, None) is not None:
+            JSONHandler._write_manifest(filename, data)
 
     # ==========================================
     #                  WORLD
     # ==========================================
 
     @staticmethod
-    def load_world_from_json(filename: str, world_name: str, twist_file: str = "json_files/twist_structures.json") -> Optional[World]:
-        data = JSONHandler._load_safe(filename)
-        if 'worlds' in data:
-            for w in data['worlds']:
-                if w.get('world_name') == world_name:
-                    ts_name = w.get('twist_structure_name')
-                    ts = None
-                    if ts_name:
-                        ts = JSONHandler.load_twist_structure_from_json(twist_file, ts_name)
-                    
-                    return World(world_name, w.get('short_world_name'), ts, w.get('assignments', {}))
+    def load_world_from_json(
+        filename: str,
+        world_name: str,
+        twist_file: str = "json_files/twist_structures.json",
+        ts_cache: Optional[Dict[str, TwistStructure]] = None
+    ) -> Optional[World]:
+        """
+        Loads one world. When a ts_cache dict is supplied, twist structures
+        already built during the same top-level load are shared instead of
+        reconstructed per world.
+        """
+        w = JSONHandler._entry_index(filename, 'worlds', 'world_name').get(world_name)
+        if w is not None:
+            ts_name = w.get('twist_structure_name')
+            ts = None
+            if ts_name:
+                if ts_cache is not None and ts_name in ts_cache:
+                    ts = ts_cache[ts_name]
+                else:
+                    ts = JSONHandler.load_twist_structure_from_json(twist_file, ts_name)
+                    if ts_cache is not None and ts is not None:
+                        ts_cache[ts_name] = ts
+
+            assignments = {sys.intern(p): v for p, v in w.get('assignments', {}).items()}
+            short_name = w.get('short_world_name')
+            return World(sys.intern(world_name), sys.intern(short_name) if short_name else short_name, ts, assignments)
         return None
 
     @staticmethod
     def save_world_to_json(filename: str, new_world: World) -> bool:
         try:
             data = JSONHandler._load_safe(filename)
-            if 'worlds' not in data: data['worlds'] = []
-            
-            w_list = [w for w in data['worlds'] if w.get('world_name') != new_world.name_long]
-            
-            w_dict = {
+            data.setdefault('worlds', {})[new_world.name_long] = {
                 "world_name": new_world.name_long,
                 "short_world_name": new_world.name_short,
                 "twist_structure_name": new_world.twist_structure.name if new_world.twist_structure else None,
                 "assignments": new_world.assignments
             }
-            w_list.append(w_dict)
-            data['worlds'] = w_list
-            
-            with open(filename, 'w') as f: f.write(JSONHandler._compact_json(data))
+            JSONHandler._write_manifest(filename, data)
             return True
         except Exception as e: 
             print(f"Save world error: {e}")
             return False
 
+    @staticmethod
+    def save_worlds_to_json(filename: str, new_worlds) -> bool:
+        """Saves several worlds in one read-modify-write pass over the file."""
+        try:
+            data = JSONHandler._load_safe(filename)
+            w_map = data.setdefault('worlds', {})
+            for new_world in new_worlds:
+                w_map[new_world.name_long] = {
+                    "world_name": new_world.name_long,
+                    "short_world_name": new_world.name_short,
+                    "twist_structure_name": new_world.twist_structure.name if new_world.twist_structure else None,
+                    "assignments": new_world.assignments
+                }
+            JSONHandler._write_manifest(filename, data)
+            return True
+        except Exception as e: 
+            print(f"Save worlds error: {e}")
+            return False
+
     @staticmethod
     def delete_world_from_json(filename: str, w_name: str) -> None:
         data = JSONHandler._load_safe(filename)
-        if 'worlds' in data:
-            data['worlds'] = [w for w in data['worlds'] if w.get('world_name') != w_name]
-            with open(filename, 'w') as f: f.write(JSONHandler._compact_json(data))
+        if data.get('worlds', {}).pop(w_name, None) is not None:
+            JSONHandler._write_manifest(filename, data)
 
     # ==========================================
     #                  MODEL
@@ -280,64 +450,63 @@ class JSONHandler:
         worlds_file: str = "json_files/worlds.json",
         twist_file: str = "json_files/twist_structures.json"
     ) -> Optional[Model]:
-        data = JSONHandler._load_safe(filename)
-        if 'models' in data:
-            for m in data['models']:
-                if m.get('model_name') == model_name:
-                    try:
-                        # 1. Load Twist Structure
-                        ts_name = m.get('twist_structure_name')
-                        ts = JSONHandler.load_twist_structure_from_json(twist_file, ts_name)
-                        
-                        # 2. Load Worlds
-                        w_set, w_map = set(), {}
-                        for wn in m.get("worlds", []):
-                            w_obj = JSONHandler.load_world_from_json(worlds_file, wn)
-                            if w_obj:
-                                w_set.add(w_obj)
-                                w_map[w_obj.name_long] = w_obj
-                        
-                        # 3. Relations (Weighted)
-                        # Structure: Act -> Source -> {Target -> WeightTuple}
-                        rels = {}
-                        raw_rels = m.get("accessibility_relations", {})
-                        
-                        for act, src_map in raw_rels.items():
-                            rels[act] = {}
-                            for src_name, tgt_data in src_map.items():
-                                if src_name in w_map:
-                                    src_w = w_map[src_name]
-                                    rels[act][src_w] = {}
-                                    
-                                    # Handle weighted format (Dict[TargetName, WeightList])
-                                    if isinstance(tgt_data, dict):
-                                        for tgt_name, weight in tgt_data.items():
-                                            if tgt_name in w_map:
-                                                # Convert list back to tuple
-                                                rels[act][src_w][w_map[tgt_name]] = tuple(weight)
-                                    
-                                    # Handle legacy list format
-                                    elif isinstance(tgt_data, list):
-                                        top_val = (ts.residuated_lattice.top, ts.residuated_lattice.bottom)
-                                        for tgt_name in tgt_data:
-                                            if tgt_name in w_map:
-                                                rels[act][src_w][w_map[tgt_name]] = top_val
-
-                        return Model(
-                            model_name, ts, w_set,
-                            rels, set(m.get('props', [])), set(raw_rels.keys()), description=m.get('description', "")
-                        )
-                    except Exception as e: 
-                        print(f"Error loading model {model_name}: {e}")
-                        return None
+        m = JSONHandler._entry_index(filename, 'models', 'model_name').get(model_name)
+        if m is not None:
+            try:
+                # 1. Load Twist Structure
+                ts_name = m.get('twist_structure_name')
+                ts = JSONHandler.load_twist_structure_from_json(twist_file, ts_name)
+
+                # 2. Load Worlds, sharing the structure built above so each
+                # world does not rebuild its own copy.
+                ts_cache = {ts_name: ts} if ts is not None else {}
+                w_set, w_map = set(), {}
+                for wn in m.get("worlds", []):
+                    w_obj = JSONHandler.load_world_from_json(worlds_file, wn, twist_file, ts_cache)
+                    if w_obj:
+                        w_set.add(w_obj)
+                        w_map[w_obj.name_long] = w_obj
+                
+                # 3. Relations (Weighted)
+                # Structure: Act -> Source -> {Target -> WeightTuple}
+                rels = {}
+                raw_rels = m.get("accessibility_relations", {})
+                
+                for act, src_map in raw_rels.items():
+                    act = sys.intern(act)
+                    rels[act] = {}
+                    for src_name, tgt_data in src_map.items():
+                        if src_name in w_map:
+                            src_w = w_map[src_name]
+                            rels[act][src_w] = {}
+                            
+                            # Handle weighted format (Dict[TargetName, WeightList])
+                            if isinstance(tgt_data, dict):
+                                for tgt_name, weight in tgt_data.items():
+                                    if tgt_name in w_map:
+                                        # Convert list back to tuple
+                                        rels[act][src_w][w_map[tgt_name]] = tuple(weight)
+                            
+                            # Handle legacy list format
+                            elif isinstance(tgt_data, list):
+                                top_val = (ts.residuated_lattice.top, ts.residuated_lattice.bottom)
+                                for tgt_name in tgt_data:
+                                    if tgt_name in w_map:
+                                        rels[act][src_w][w_map[tgt_name]] = top_val
+
+                return Model(
+                    model_name, ts, w_set,
+                    rels, {sys.intern(p) for p in m.get('props', [])}, set(rels.keys()), description=m.get('description', "")
+                )
+            except Exception as e: 
+                print(f"Error loading model {model_name}: {e}")
+                return None
         return None
 
     @staticmethod
     def save_model_to_json(filename: str, new_model: Model) -> bool:
         try:
             data = JSONHandler._load_safe(filename)
-            if 'models' not in data: data['models'] = []
-            m_list = [m for m in data['models'] if m.get('model_name') != new_model.name_model]
             
             # Save relations with weights
             # Structure: Act -> SourceName -> {TargetName -> WeightList}
@@ -354,17 +523,16 @@ class JSONHandler:
                         if t_json:
                             acc_json[act][src.name_long] = t_json
 
-            m_list.append({
+            data.setdefault('models', {})[new_model.name_model] = {
                 "model_name": new_model.name_model,
                 "description": new_model.description,
                 "twist_structure_name": new_model.twist_structure.name,
                 "worlds": [w.name_long for w in new_model.worlds],
                 "accessibility_relations": acc_json,
                 "props": list(new_model.props)
-            })
-            data['models'] = m_list
-            
-            with open(filename, 'w') as f: f.write(JSONHandler._compact_json(data))
+            }
+
+            JSONHandler._write_manifest(filename, data)
             return True
         except Exception as e:
             print(f"Save Model Error: {e}")
@@ -373,11 +541,19 @@ class JSONHandler:
     @staticmethod
     def delete_model_from_json(filename: str, model_name: str) -> None:
         data = JSONHandler._load_safe(filename)
-        if 'models' in data:
-            data['models'] = [m for m in data['models'] if m.get('model_name') != model_name]
-            with open(filename, 'w') as f: f.write(JSONHandler._compact_json(data))
+        if data.get('models', {}).pop(model_name, None) is not None:
+            JSONHandler._write_manifest(filename, data)
 
     @staticmethod
     def get_names_from_json(filename: str, json_key: str, name_key: str) -> List[str]:
-        data = JSONHandler._load_safe(filename)
-        return [i[name_key] for i in data.get(json_key, []) if name_key in i]
\ No newline at end of file
+        """Names listed in one manifest, cached on file mtime. Do not mutate."""
+        try:
+            mtime_ns = os.stat(filename).st_mtime_ns
+        except OSError:
+            return []
+        return JSONHandler._names_cached(filename, json_key, name_key, mtime_ns)
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _names_cached(filename: str, json_key: str, name_key: str, mtime_ns: int) -> List[str]:
+        return list(JSONHandler._index_cached(filename, json_key, name_key, mtime_ns))
\ No newline at end of file
@@ -5,8 +5,8 @@ This module defines classes for representing Lattices, Residuated Lattices, and
 It provides methods for algebraic operations (meet, join, implication) and visualization.
 """
 
-from typing import Set, Dict, Tuple, Optional, List
-from collections import defaultdict
+from typing import Set, Dict, Tuple, Optional, List, Iterable
+from collections import defaultdict, deque
 
 # Optional dependencies for visualization
 try:
@@ -16,6 +16,22 @@ try:
 except ImportError:
     VISUALIZATION_AVAILABLE = False
 
+# HELPER: Hasse cover relation from a (transitively closed) partial order
+def _cover_edges(relations):
+    """
+    Returns the cover edges a -< b: a < b with nothing strictly between.
+    Works straight off the stored order, so drawing needs no generic
+    transitive-reduction pass over a full DiGraph.
+    """
+    up = defaultdict(set)
+    down = defaultdict(set)
+    for a, b in relations:
+        if a != b:
+            up[a].add(b)
+            down[b].add(a)
+    return [(a, b) for a, bs in up.items() for b in bs if not (bs & down[b])]
+
+
 # HELPER: Custom Layout for Hasse Diagrams
 def _compute_hasse_layout(G):
     """
@@ -26,20 +42,24 @@ def _compute_hasse_layout(G):
     if not G.nodes: return {}
 
     # 1. Layer Assignment (Longest path from a root)
-    layers = {}
-    try:
-        # Topological sort ensures we process parents after children
-        sorted_nodes = list(nx.topological_sort(G))
-    except:
+    # Kahn's algorithm assigns layers in one pass as the frontier advances,
+    # with no separate topological sort or per-node predecessor lists.
+    indeg = {n: G.in_degree(n) for n in G.nodes}
+    queue = deque(n for n, d in indeg.items() if d == 0)
+    layers = {n: 0 for n in queue}
+    while queue:
+        u = queue.popleft()
+        next_layer = layers[u] + 1
+        for v in G.successors(u):
+            if layers.get(v, -1) < next_layer:
+                layers[v] = next_layer
+            indeg[v] -= 1
+            if indeg[v] == 0:
+                queue.append(v)
+    if len(layers) < G.number_of_nodes():
+        # Cycle: not a valid order diagram, fall back to a generic layout.
         return nx.spring_layout(G)
 
-    for n in sorted_nodes:
-        preds = list(G.predecessors(n))
-        if preds:
-            layers[n] = max(layers[p] for p in preds) + 1
-        else:
-            layers[n] = 0
-
     # Group nodes by layer
     layer_nodes = defaultdict(list)
     for n, l in layers.items():
@@ -51,22 +71,24 @@ def _compute_hasse_layout(G):
     
     # Initial placement for layer 0 (Bottom)
     # Sort by string representation to be deterministic
-    layer_nodes[0].sort(key=lambda x: str(x))
+    layer_nodes[0].sort(key=str)
     width = len(layer_nodes[0])
     for i, node in enumerate(layer_nodes[0]):
         pos[node] = (i - width / 2.0) * 1.5 # Spread out
 
     # Propagate up
+    pred = G.pred
     for l in range(1, max_layer + 1):
         # For each node, calculate average x of predecessors
         node_order = []
         for node in layer_nodes[l]:
-            preds = list(G.predecessors(node))
+            # Adjacency dict view: no list copy per node.
+            preds = pred[node]
             if preds:
                 # Average X of children
                 avg_x = sum(pos[p] for p in preds) / len(preds)
             else:
-                avg_x = 0 
+                avg_x = 0
             node_order.append((node, avg_x))
         
         # Sort nodes in this layer by that average X
@@ -87,12 +109,66 @@ def _compute_hasse_layout(G):
     return final_pos
 
 
+# Layouts are pure functions of the diagram, so repeat plots of the same
+# structure reuse the previous Barycenter result.
+_layout_cache: Dict[tuple, dict] = {}
+
+
+# HELPER: Shared Hasse rendering for Lattice and TwistStructure
+def _draw_hasse(title: str, elements, relations) -> None:
+    """
+    Draws the Hasse diagram of a partial order: cover edges of the stored
+    (transitively closed) relation, Barycenter layout, auto-sized nodes.
+    """
+    if not VISUALIZATION_AVAILABLE:
+        print("Visualization libraries (networkx, matplotlib) not installed.")
+        return
+
+    if not elements:
+        print("Lattice is empty.")
+        return
+
+    # The stored order is transitively closed, so its cover edges are
+    # the Hasse diagram directly — no nx.transitive_reduction pass.
+    TR = nx.DiGraph()
+    TR.add_nodes_from(elements)
+    TR.add_edges_from(_cover_edges(relations))
+
+    key = (tuple(sorted(TR.nodes, key=str)), tuple(sorted(TR.edges, key=str)))
+    pos = _layout_cache.get(key)
+    if pos is None:
+        pos = _layout_cache[key] = _compute_hasse_layout(TR)
+
+    plt.figure(figsize=(8, 10))
+    plt.title(f"Hasse Diagram: {title}")
+
+    # Dynamic Node Size
+    labels = {node: str(node).replace("'", "") for node in TR.nodes()}
+    max_len = max((len(l) for l in labels.values()), default=1)
+    node_size = 1000 + (max_len * 300)
+
+    nx.draw_networkx_nodes(TR, pos, node_size=node_size, node_color="#A0CBE2", edgecolors="black")
+    nx.draw_networkx_labels(TR, pos, labels=labels, font_size=10, font_weight="bold")
+    nx.draw_networkx_edges(TR, pos, arrows=False, width=1.5, edge_color="gray")
+
+    plt.axis("off")
+    plt.tight_layout()
+    plt.show()
+
+
 class Lattice:
     """
     Represents a lattice with elements, a partial order, meet, join, 
     and an explicit implication mapping.
     """
 
+    __slots__ = (
+        "name", "elements", "relations", "implication_map", "bottom", "top",
+        "_meet_cache", "_join_cache",
+        "_by_index", "_index", "_leq", "_geq",
+        "_sorted_elements", "_sorted_relations", "_sorted_implication_items",
+    )
+
     def __init__(
         self,
         name: str,
@@ -105,125 +181,231 @@ class Lattice:
         self.relations = set(relations)
         self.implication_map = implication_map if implication_map is not None else {}
 
+        # Memoized meet/join lookup tables, filled on demand.
+        self._meet_cache: Dict[Tuple[str, str], str] = {}
+        self._join_cache: Dict[Tuple[str, str], str] = {}
+
+        self._build_order_masks()
+
+        # Lazily computed display orderings, cached after the first request.
+        self._sorted_elements = None
+        self._sorted_relations = None
+        self._sorted_implication_items = None
+
         if not self._check_is_lattice():
             raise ValueError(f"The object '{name}' is not a valid lattice.")
 
         self.bottom = self.meet_set(self.elements)
         self.top = self.join_set(self.elements)
 
+    @classmethod
+    def from_trusted_data(
+        cls,
+        name: str,
+        elements: Set[str],
+        relations: Set[Tuple[str, str]],
+        implication_map: Optional[Dict[Tuple[str, str], str]] = None
+    ) -> "Lattice":
+        """
+        Builds a Lattice from data that already passed validation when it was
+        saved, skipping the O(n^4) lattice-axiom check in __init__.
+        """
+        obj = cls.__new__(cls)
+        obj.name = name
+        obj.elements = set(elements)
+        obj.relations = set(relations)
+        obj.implication_map = implication_map if implication_map is not None else {}
+        obj._meet_cache = {}
+        obj._join_cache = {}
+        obj._build_order_masks()
+        obj._sorted_elements = None
+        obj._sorted_relations = None
+        obj._sorted_implication_items = None
+        # Bottom/top fall out of the (reflexive) order masks directly.
+        full = (1 << len(obj._by_index)) - 1
+        obj.bottom = next(x for x in obj._by_index if obj._leq[x] == full)
+        obj.top = next(x for x in obj._by_index if obj._geq[x] == full)
+        return obj
+
+    def _build_order_masks(self) -> None:
+        """
+        Encodes the partial order as per-element bitmasks: bit j of _leq[x]
+        is set iff x <= element j, and _geq is the transpose. Meet and join
+        then reduce to integer ANDs instead of set probes over all elements.
+        """
+        by_index = sorted(self.elements)
+        index = {e: i for i, e in enumerate(by_index)}
+        leq = {e: 0 for e in by_index}
+        geq = {e: 0 for e in by_index}
+        for a, b in self.relations:
+            ia = index.get(a)
+            ib = index.get(b)
+            if ia is None or ib is None:
+                continue
+            leq[a] |= 1 << ib
+            geq[b] |= 1 << ia
+        self._by_index = by_index
+        self._index = index
+        self._leq = leq
+        self._geq = geq
+
     def is_less_than_or_equal(self, a: str, b: str) -> bool:
-        return (a, b) in self.relations
+        mask = self._leq.get(a)
+        ib = self._index.get(b)
+        if mask is None or ib is None:
+            return False
+        return (mask >> ib) & 1 == 1
+
+    def sorted_elements(self) -> list:
+        """Sorted element list, cached after the first call."""
+        if self._sorted_elements is None:
+            self._sorted_elements = sorted(self.elements)
+        return self._sorted_elements
+
+    def sorted_relations(self) -> list:
+        """Sorted relation pairs, cached after the first call."""
+        if self._sorted_relations is None:
+            self._sorted_relations = sorted(self.relations)
+        return self._sorted_relations
+
+    def sorted_implication_items(self) -> list:
+        """Implication-map items sorted by pair, cached after the first call."""
+        if self._sorted_implication_items is None:
+            self._sorted_implication_items = sorted(
+                self.implication_map.items(), key=lambda x: str(x[0])
+            )
+        return self._sorted_implication_items
 
     def join(self, a: str, b: str) -> str:
-        if a not in self.elements or b not in self.elements:
+        cached = self._join_cache.get((a, b))
+        if cached is not None:
+            return cached
+        leq = self._leq
+        ma = leq.get(a)
+        mb = leq.get(b)
+        if ma is None or mb is None:
             raise ValueError(f"Elements '{a}' or '{b}' not in the lattice.")
-        upper_bounds = {
-            x for x in self.elements 
-            if self.is_less_than_or_equal(a, x) and self.is_less_than_or_equal(b, x)
-        }
+        upper_bounds = ma & mb
         if not upper_bounds:
             raise ValueError(f"No common upper bounds found for '{a}' and '{b}'.")
-        for x in upper_bounds:
-            if all(self.is_less_than_or_equal(x, y) for y in upper_bounds):
+        by_index = self._by_index
+        m = upper_bounds
+        while m:
+            low = m & -m
+            x = by_index[low.bit_length() - 1]
+            # x is the join iff it lies below every common upper bound.
+            if upper_bounds & leq[x] == upper_bounds:
+                self._join_cache[(a, b)] = x
                 return x
+            m ^= low
         raise ValueError(f"No unique Join found for '{a}' and '{b}'.")
 
     def meet(self, a: str, b: str) -> str:
-        if a not in self.elements or b not in self.elements:
+        cached = self._meet_cache.get((a, b))
+        if cached is not None:
+            return cached
+        geq = self._geq
+        ma = geq.get(a)
+        mb = geq.get(b)
+        if ma is None or mb is None:
             raise ValueError(f"Elements '{a}' or '{b}' not in the lattice.")
-        lower_bounds = {
-            x for x in self.elements 
-            if self.is_less_than_or_equal(x, a) and self.is_less_than_or_equal(x, b)
-        }
+        lower_bounds = ma & mb
         if not lower_bounds:
             raise ValueError(f"No common lower bounds found for '{a}' and '{b}'.")
-        for x in lower_bounds:
-            if all(self.is_less_than_or_equal(y, x) for y in lower_bounds):
+        by_index = self._by_index
+        m = lower_bounds
+        while m:
+            low = m & -m
+            x = by_index[low.bit_length() - 1]
+            # x is the meet iff it lies above every common lower bound.
+            if lower_bounds & geq[x] == lower_bounds:
+                self._meet_cache[(a, b)] = x
                 return x
+            m ^= low
         raise ValueError(f"No unique Meet found for '{a}' and '{b}'.")
 
     def implication(self, a: str, b: str) -> Optional[str]:
         return self.implication_map.get((a, b))
 
-    def meet_set(self, subset: Optional[Set[str]] = None) -> str:
-        if subset is None: subset = set()
-        subset_list = list(subset)
-        if not subset_list: return self.top
-        lower = subset_list[0]
-        for element in subset_list:
-            lower = self.meet(lower, element)
-        return lower
-
-    def join_set(self, subset: Optional[Set[str]] = None) -> str:
-        if subset is None: subset = set()
-        subset_list = list(subset)
-        if not subset_list: return self.bottom
-        greatest = subset_list[0]
-        for element in subset_list:
-            greatest = self.join(greatest, element)
-        return greatest
+    def meet_set(self, subset: Optional[Iterable[str]] = None) -> str:
+        it = iter(subset) if subset is not None else iter(())
+        acc = next(it, None)
+        if acc is None:
+            return self.top
+        # getattr: during __init__ the folds run before bottom/top are set.
+        bottom = getattr(self, "bottom", None)
+        for element in it:
+            if acc == bottom:
+                return acc
+            if element != acc:
+                acc = self.meet(acc, element)
+        return acc
+
+    def join_set(self, subset: Optional[Iterable[str]] = None) -> str:
+        it = iter(subset) if subset is not None else iter(())
+        acc = next(it, None)
+        if acc is None:
+            return self.bottom
+        top = getattr(self, "top", None)
+        for element in it:
+            if acc == top:
+                return acc
+            if element != acc:
+                acc = self.join(acc, element)
+        return acc
 
     def _check_is_lattice(self) -> bool:
-        try:
-            for x in self.elements:
-                for y in self.elements:
-                    self.meet(x, y)
-                    self.join(x, y)
-            return True
-        except ValueError as e:
-            print(f"Lattice check failed: {e}")
+        # Validates straight off the bitmask encoding: each unordered pair
+        # costs two ANDs plus a set-bit walk, with no meet/join calls and
+        # no cache traffic, and (x, y) covers (y, x) for free.
+        by_index = self._by_index
+        leq = self._leq
+        geq = self._geq
+
+        def has_least_or_greatest(bounds: int, masks: Dict[str, int]) -> bool:
+            m = bounds
+            while m:
+                low = m & -m
+                e = by_index[low.bit_length() - 1]
+                if bounds & masks[e] == bounds:
+                    return True
+                m ^= low
             return False
 
+        for i, x in enumerate(by_index):
+            geq_x = geq[x]
+            leq_x = leq[x]
+            for y in by_index[i:]:
+                lower_bounds = geq_x & geq[y]
+                if not lower_bounds:
+                    print(f"Lattice check failed: No common lower bounds found for '{x}' and '{y}'.")
+                    return False
+                if not has_least_or_greatest(lower_bounds, geq):
+                    print(f"Lattice check failed: No unique Meet found for '{x}' and '{y}'.")
+                    return False
+                upper_bounds = leq_x & leq[y]
+                if not upper_bounds:
+                    print(f"Lattice check failed: No common upper bounds found for '{x}' and '{y}'.")
+                    return False
+                if not has_least_or_greatest(upper_bounds, leq):
+                    print(f"Lattice check failed: No unique Join found for '{x}' and '{y}'.")
+                    return False
+        return True
+
     def draw_hasse(self) -> None:
         """
         Draws the Hasse Diagram of the lattice using NetworkX.
         Uses custom Barycenter Layout for clean, untangled layers.
         """
-        if not VISUALIZATION_AVAILABLE:
-            print("Visualization libraries (networkx, matplotlib) not installed.")
-            return
-
-        if not self.elements:
-            print("Lattice is empty.")
-            return
-
-        G = nx.DiGraph()
-        G.add_nodes_from(self.elements)
-        
-        edges = [(a, b) for a, b in self.relations if a != b]
-        G.add_edges_from(edges)
-
-        # Transitive Reduction
-        try:
-            TR = nx.transitive_reduction(G)
-        except Exception as e:
-            print(f"Warning: Transitive reduction failed ({e}). Using full graph.")
-            TR = G
-
-        # Use Custom Layout
-        pos = _compute_hasse_layout(TR)
-
-        plt.figure(figsize=(8, 10))
-        plt.title(f"Hasse Diagram: {self.name}")
-
-        # Dynamic Node Size
-        labels = {node: str(node).replace("'", "") for node in TR.nodes()}
-        max_len = max((len(l) for l in labels.values()), default=1)
-        node_size = 1000 + (max_len * 300)
-
-        nx.draw_networkx_nodes(TR, pos, node_size=node_size, node_color="#A0CBE2", edgecolors="black")
-        nx.draw_networkx_labels(TR, pos, labels=labels, font_size=10, font_weight="bold")
-        nx.draw_networkx_edges(TR, pos, arrows=False, width=1.5, edge_color="gray")
-        
-        plt.axis("off")
-        plt.tight_layout()
-        plt.show()
+        _draw_hasse(self.name, self.elements, self.relations)
 
     def __repr__(self) -> str:
         return f"{self.name}"
 
 
 class ResiduatedLattice(Lattice):
+    __slots__ = ("name_residuated_lattice",)
+
     def __init__(
         self,
         name_residuated_lattice: str,
@@ -235,8 +417,29 @@ class ResiduatedLattice(Lattice):
         super().__init__(name_lattice, elements, relations, implication_map)
         self.name_residuated_lattice = name_residuated_lattice
 
+    @classmethod
+    def from_trusted_data(
+        cls,
+        name_residuated_lattice: str,
+        name_lattice: str,
+        elements: Set[str],
+        relations: Set[Tuple[str, str]],
+        implication_map: Dict[Tuple[str, str], str]
+    ) -> "ResiduatedLattice":
+        """Builds a ResiduatedLattice from saved data without re-validation."""
+        obj = super().from_trusted_data(name_lattice, elements, relations, implication_map)
+        obj.name_residuated_lattice = name_residuated_lattice
+        return obj
+
 
 class TwistStructure:
+    __slots__ = (
+        "name", "residuated_lattice", "elements",
+        "truth_relation", "qntt_info_relation",
+        "_sorted_elements", "_sorted_truth_relation", "_toposorted_elements",
+        "_op_cache", "_top_pair", "_bot_pair",
+    )
+
     def __init__(self, residuated_lattice: ResiduatedLattice):
         if not isinstance(residuated_lattice, ResiduatedLattice):
             raise TypeError("Argument must be a ResiduatedLattice.")
@@ -246,6 +449,60 @@ class TwistStructure:
         self.truth_relation = self._build_truth_order()
         self.qntt_info_relation = self._build_quantity_info_order()
 
+        # Lazily computed display orderings, cached after the first request.
+        self._sorted_elements = None
+        self._sorted_truth_relation = None
+        self._toposorted_elements = None
+        # (op, pair1, pair2) -> result memo for the algebraic operations.
+        self._op_cache: Dict[tuple, Tuple[str, str]] = {}
+        # Designated truth values, resolved once for the evaluator hot path.
+        self._top_pair = (residuated_lattice.top, residuated_lattice.bottom)
+        self._bot_pair = (residuated_lattice.bottom, residuated_lattice.top)
+
+    def sorted_elements(self) -> list:
+        """Sorted twist pairs, cached after the first call."""
+        if self._sorted_elements is None:
+            self._sorted_elements = sorted(
+                self.elements, key=lambda x: (str(x[0]), str(x[1]))
+            )
+        return self._sorted_elements
+
+    def sorted_truth_relation(self) -> list:
+        """Truth-order pairs sorted for display, cached after the first call."""
+        if self._sorted_truth_relation is None:
+            self._sorted_truth_relation = sorted(
+                self.truth_relation, key=lambda x: (str(x[0]), str(x[1]))
+            )
+        return self._sorted_truth_relation
+
+    @classmethod
+    def from_trusted_data(
+        cls,
+        residuated_lattice: ResiduatedLattice,
+        name: str,
+        elements: Optional[Set[Tuple[str, str]]] = None,
+        truth_relation=None,
+        qntt_info_relation=None
+    ) -> "TwistStructure":
+        """
+        Builds a TwistStructure from saved data, reusing the pre-calculated
+        element set and order relations instead of re-deriving them (each of
+        which is quadratic in the number of pairs).
+        """
+        obj = cls.__new__(cls)
+        obj.residuated_lattice = residuated_lattice
+        obj.name = name
+        obj.elements = elements if elements is not None else obj._build_elements()
+        obj.truth_relation = truth_relation if truth_relation is not None else obj._build_truth_order()
+        obj.qntt_info_relation = qntt_info_relation if qntt_info_relation is not None else obj._build_quantity_info_order()
+        obj._sorted_elements = None
+        obj._sorted_truth_relation = None
+        obj._toposorted_elements = None
+        obj._op_cache = {}
+        obj._top_pair = (residuated_lattice.top, residuated_lattice.bottom)
+        obj._bot_pair = (residuated_lattice.bottom, residuated_lattice.top)
+        return obj
+
     def _build_elements(self) -> Set[Tuple[str, str]]:
         return {
             (e1, e2) 
@@ -253,29 +510,44 @@ class TwistStructure:
             for e2 in self.residuated_lattice.elements
         }
 
-    def _build_truth_order(self) -> Set[Tuple[Tuple[str, str], Tuple[str, str]]]:
-        relation = set()
+    def _up_down_sets(self):
+        """Per-element lists of everything above / below it in the base order."""
         rl = self.residuated_lattice
-        for p1 in self.elements:
-            for p2 in self.elements:
-                if rl.is_less_than_or_equal(p1[0], p2[0]) and rl.is_less_than_or_equal(p2[1], p1[1]):
-                    relation.add((p1, p2))
-        return relation
+        up = {e: [y for y in rl.elements if rl.is_less_than_or_equal(e, y)] for e in rl.elements}
+        down = {e: [y for y in rl.elements if rl.is_less_than_or_equal(y, e)] for e in rl.elements}
+        return up, down
+
+    def _build_truth_order(self) -> Set[Tuple[Tuple[str, str], Tuple[str, str]]]:
+        # Enumerate only the related pairs straight from the up/down sets
+        # instead of testing all |elements|^2 combinations.
+        up, down = self._up_down_sets()
+        by_pair = {p: p for p in self.elements}
+        return {
+            (p1, by_pair[(t2, f2)])
+            for p1 in self.elements
+            for t2 in up[p1[0]]
+            for f2 in down[p1[1]]
+        }
 
     def _build_quantity_info_order(self) -> Set[Tuple[Tuple[str, str], Tuple[str, str]]]:
-        relation = set()
-        rl = self.residuated_lattice
-        for p1 in self.elements:
-            for p2 in self.elements:
-                if rl.is_less_than_or_equal(p1[0], p2[0]) and rl.is_less_than_or_equal(p1[1], p2[1]):
-                    relation.add((p1, p2))
-        return relation
+        up, _ = self._up_down_sets()
+        by_pair = {p: p for p in self.elements}
+        return {
+            (p1, by_pair[(t2, f2)])
+            for p1 in self.elements
+            for t2 in up[p1[0]]
+            for f2 in up[p1[1]]
+        }
     
     def toposort_twist_elements(self):
         """
         Returns elements of a TwistStructure ordered bottom → top
         according to the truth order. Incomparable elements are allowed.
+        Cached after the first call; the structure is immutable once built.
         """
+        if self._toposorted_elements is not None:
+            return self._toposorted_elements
+
         from collections import defaultdict, deque
 
         successors = defaultdict(set)
@@ -305,9 +577,14 @@ class TwistStructure:
                 if not predecessors[s]:
                     queue.append(s)
 
+        self._toposorted_elements = result
         return result
 
     def implication(self, pair1: Tuple[str, str], pair2: Tuple[str, str]) -> Tuple[str, str]:
+        key = ("imp", pair1, pair2)
+        cached = self._op_cache.get(key)
+        if cached is not None:
+            return cached
         rl = self.residuated_lattice
         t1, f1 = pair1
         t2, f2 = pair2
@@ -317,15 +594,27 @@ class TwistStructure:
             raise ValueError("Implication definition missing in base lattice.")
         meet_imp = rl.meet(imp_t1_t2, imp_f2_f1)
         meet_t1_f2 = rl.meet(t1, f2)
-        return (meet_imp, meet_t1_f2)
+        result = (meet_imp, meet_t1_f2)
+        self._op_cache[key] = result
+        return result
 
     def consensus(self, pair1: Tuple[str, str], pair2: Tuple[str, str]) -> Tuple[str, str]:
+        key = ("con", pair1, pair2)
+        cached = self._op_cache.get(key)
+        if cached is not None:
+            return cached
         rl = self.residuated_lattice
         meet_t = rl.meet(pair1[0], pair2[0])
-        meet_f = rl.meet(pair1[1], pair2[1]) 
-        return (meet_t, meet_f)
+        meet_f = rl.meet(pair1[1], pair2[1])
+        result = (meet_t, meet_f)
+        self._op_cache[key] = result
+        return result
 
     def residue_meet(self, pair1: Tuple[str, str], pair2: Tuple[str, str]) -> Tuple[str, str]:
+        key = ("rme", pair1, pair2)
+        cached = self._op_cache.get(key)
+        if cached is not None:
+            return cached
         rl = self.residuated_lattice
         t1, f1 = pair1
         t2, f2 = pair2
@@ -335,39 +624,96 @@ class TwistStructure:
         if imp1 is None or imp2 is None:
             raise ValueError("Implication definition missing in base lattice for residue_meet.")
         meet_imp = rl.meet(imp1, imp2)
-        return (meet_t, meet_imp)
+        result = (meet_t, meet_imp)
+        self._op_cache[key] = result
+        return result
 
     def negation(self, pair): 
         return (pair[1], pair[0])
         
     def weak_meet(self, pair1, pair2): 
+        key = ("wme", pair1, pair2)
+        cached = self._op_cache.get(key)
+        if cached is not None:
+            return cached
         rl = self.residuated_lattice
-        return (rl.meet(pair1[0], pair2[0]), rl.join(pair1[1], pair2[1]))
+        result = (rl.meet(pair1[0], pair2[0]), rl.join(pair1[1], pair2[1]))
+        self._op_cache[key] = result
+        return result
         
     def weak_join(self, pair1, pair2):
+        key = ("wjo", pair1, pair2)
+        cached = self._op_cache.get(key)
+        if cached is not None:
+            return cached
         rl = self.residuated_lattice
-        return (rl.join(pair1[0], pair2[0]), rl.meet(pair1[1], pair2[1]))
+        result = (rl.join(pair1[0], pair2[0]), rl.meet(pair1[1], pair2[1]))
+        self._op_cache[key] = result
+        return result
         
     def accept_all(self, pair1, pair2):
+        key = ("acc", pair1, pair2)
+        cached = self._op_cache.get(key)
+        if cached is not None:
+            return cached
         rl = self.residuated_lattice
-        return (rl.join(pair1[0], pair2[0]), rl.join(pair1[1], pair2[1]))
+        result = (rl.join(pair1[0], pair2[0]), rl.join(pair1[1], pair2[1]))
+        self._op_cache[key] = result
+        return result
+
+    def biconditional(self, pair1, pair2):
+        """
+        Fused (~a | b) & (~b | a): one memo probe and the base-lattice
+        operations inlined, instead of two negations, two weak joins and
+        a weak meet each allocating and caching an intermediate pair.
+        """
+        key = ("bic", pair1, pair2)
+        cached = self._op_cache.get(key)
+        if cached is not None:
+            return cached
+        rl = self.residuated_lattice
+        t1, f1 = pair1
+        t2, f2 = pair2
+        result = (
+            rl.meet(rl.join(f1, t2), rl.join(f2, t1)),
+            rl.join(rl.meet(t1, f2), rl.meet(t2, f1)),
+        )
+        self._op_cache[key] = result
+        return result
+
+    def is_top(self, pair: Tuple[str, str]) -> bool:
+        """Whether the pair is the designated top value (top, bottom)."""
+        return pair == self._top_pair
+
+    def is_bot(self, pair: Tuple[str, str]) -> bool:
+        """Whether the pair is the designated bottom value (bottom, top)."""
+        return pair == self._bot_pair
+
+    def weak_meet_incremental(self, acc: Tuple[str, str], pair: Tuple[str, str]) -> Tuple[Tuple[str, str], bool]:
+        """
+        Folds one pair into a running weak meet. Returns the new accumulator
+        and whether it reached the absorbing element (bottom, top), at which
+        point further meets cannot change the result.
+        """
+        rl = self.residuated_lattice
+        result = self.weak_meet(acc, pair)
+        return result, result == (rl.bottom, rl.top)
 
     def weak_meet_set(self, pairs: List[Tuple[str, str]]) -> Tuple[str, str]:
         if not pairs:
             return (self.residuated_lattice.top, self.residuated_lattice.bottom)
-        t_list = [p[0] for p in pairs]
-        f_list = [p[1] for p in pairs]
-        final_t = self.residuated_lattice.meet_set(set(t_list))
-        final_f = self.residuated_lattice.join_set(set(f_list))
+        # The folds skip repeated accumulators themselves, so no set() pass
+        # or intermediate list is needed; duplicates are harmless (meet and
+        # join are idempotent).
+        final_t = self.residuated_lattice.meet_set(p[0] for p in pairs)
+        final_f = self.residuated_lattice.join_set(p[1] for p in pairs)
         return (final_t, final_f)
 
     def weak_join_set(self, pairs: List[Tuple[str, str]]) -> Tuple[str, str]:
         if not pairs:
             return (self.residuated_lattice.bottom, self.residuated_lattice.top)
-        t_list = [p[0] for p in pairs]
-        f_list = [p[1] for p in pairs]
-        final_t = self.residuated_lattice.join_set(set(t_list))
-        final_f = self.residuated_lattice.meet_set(set(f_list))
+        final_t = self.residuated_lattice.join_set(p[0] for p in pairs)
+        final_f = self.residuated_lattice.meet_set(p[1] for p in pairs)
         return (final_t, final_f)
     
     def draw_hasse(self) -> None:
@@ -375,38 +721,4 @@ class TwistStructure:
         Draws the Hasse Diagram of the Twist Structure using NetworkX.
         Uses custom Barycenter Layout.
         """
-        if not VISUALIZATION_AVAILABLE:
-            print("Visualization libraries (networkx, matplotlib) not installed.")
-            return
-
-        if not self.elements:
-            print("Lattice is empty.")
-            return
-
-        G = nx.DiGraph()
-        G.add_nodes_from(self.elements)
-        edges = [(a, b) for a, b in self.truth_relation if a != b]
-        G.add_edges_from(edges)
-
-        try:
-            TR = nx.transitive_reduction(G)
-        except Exception as e:
-            print(f"Warning: Transitive reduction failed ({e}). Using full graph.")
-            TR = G
-
-        pos = _compute_hasse_layout(TR)
-
-        plt.figure(figsize=(8, 10))
-        plt.title(f"Hasse Diagram: {self.name}")
-
-        labels = {node: str(node).replace("'", "") for node in TR.nodes()}
-        max_len = max((len(l) for l in labels.values()), default=1)
-        node_size = 1000 + (max_len * 300)
-
-        nx.draw_networkx_nodes(TR, pos, node_size=node_size, node_color="#A0CBE2", edgecolors="black")
-        nx.draw_networkx_labels(TR, pos, labels=labels, font_size=10, font_weight="bold")
-        nx.draw_networkx_edges(TR, pos, arrows=False, width=1.5, edge_color="gray")
-        
-        plt.axis("off")
-        plt.tight_layout()
-        plt.show()
\ No newline at end of file
+        _draw_hasse(self.name, self.elements, self.truth_relation)
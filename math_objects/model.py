@@ -16,16 +16,28 @@ try:
     import matplotlib.pyplot as plt
     from matplotlib.path import Path
     from matplotlib.patches import PathPatch
+    from matplotlib.collections import PatchCollection
     VISUALIZATION_AVAILABLE = True
 except ImportError:
     VISUALIZATION_AVAILABLE = False
 
+# Spring layouts are deterministic for a fixed node set and seed, so
+# re-drawing the same model reuses the previous result.
+_spring_layout_cache: Dict[tuple, dict] = {}
+
 
 class Model:
     """
     Represents a Paraconsistent Model (W, R, V).
     """
 
+    __slots__ = (
+        "name_model", "twist_structure", "worlds", "props", "actions",
+        "description", "accessibility_relations", "transitions",
+        "_successors", "_sources", "_sorted_world_names", "_bottom_weight",
+        "_world_by_name",
+    )
+
     def __init__(
         self,
         name_model: str,
@@ -44,38 +56,79 @@ class Model:
         self.name_model = name_model
         self.twist_structure = twist_structure
         self.worlds = worlds
+        self._world_by_name = {w.name_short: w for w in worlds}
         self.props = props if props is not None else set()
         self.actions = actions if actions is not None else set()
         self.description = description
 
-        # R is stored as a map: R(u, a, v) = weight.
-        self.accessibility_relations = defaultdict(lambda: defaultdict(dict))
+        # R is stored as a map: R(u, a, v) = weight. Plain dicts with
+        # controlled population: lookups on missing keys never materialize
+        # empty sub-dicts the way a defaultdict chain would.
+        self.accessibility_relations: Dict[str, Dict[World, Dict[World, Tuple[str, str]]]] = {}
 
         if accessibility_relations:
             self.actions.update(accessibility_relations.keys())
             for action, src_map in accessibility_relations.items():
+                action_map = self.accessibility_relations.setdefault(action, {})
                 for src, target_map in src_map.items():
+                    src_entry = action_map.setdefault(src, {})
                     for tgt, weight in target_map.items():
                         if weight is not None:
-                            self.accessibility_relations[action][src][tgt] = weight
+                            src_entry[tgt] = weight
+
+        # Flat transition views, precomputed once: a (action, src, tgt) key
+        # per edge plus pre-sorted successor lists for iteration.
+        self.transitions: Dict[Tuple[str, str, str], Tuple[str, str]] = {}
+        self._successors: Dict[Tuple[str, str], list] = {}
+        self._sources: Dict[str, list] = {}
+        for action, src_map in self.accessibility_relations.items():
+            sources = []
+            for src, target_map in src_map.items():
+                if not target_map:
+                    continue
+                pairs = sorted(target_map.items(), key=lambda tw: tw[0].name_short)
+                self._successors[(action, src.name_short)] = pairs
+                sources.append(src)
+                for tgt, weight in pairs:
+                    self.transitions[(action, src.name_short, tgt.name_short)] = weight
+            sources.sort(key=lambda w: w.name_short)
+            self._sources[action] = sources
+
+        # Default weight for absent transitions, resolved once instead of
+        # walking twist_structure.residuated_lattice on every miss.
+        rl = self.twist_structure.residuated_lattice
+        self._bottom_weight = (rl.bottom, rl.top)
+
+        # Lazily computed, cached after the first request.
+        self._sorted_world_names = None
+
+    def sorted_world_names(self) -> list:
+        """Sorted long names of the model's worlds, cached after the first call."""
+        if self._sorted_world_names is None:
+            self._sorted_world_names = sorted(w.name_long for w in self.worlds)
+        return self._sorted_world_names
 
     def get_relation_weight(self, action: str, source: World, target: World) -> Tuple[str, str]:
         """
         Retrieves the weight (tt, ff) for the transition R(source, action, target).
         If the transition is not defined, returns Bottom (0, 1).
         """
-        if action in self.accessibility_relations:
-            if source in self.accessibility_relations[action]:
-                if target in self.accessibility_relations[action][source]:
-                    return self.accessibility_relations[action][source][target]
-        
-        return (self.twist_structure.residuated_lattice.bottom, self.twist_structure.residuated_lattice.top)
+        weight = self.transitions.get((action, source.name_short, target.name_short))
+        if weight is not None:
+            return weight
+
+        return self._bottom_weight
+
+    def sources(self, action: str) -> list:
+        """Source worlds with outgoing transitions for an action, pre-sorted by short name."""
+        return self._sources.get(action, [])
+
+    def successors(self, action: str, source: World) -> list:
+        """(target, weight) pairs for R(source, action, -), pre-sorted by target short name."""
+        return self._successors.get((action, source.name_short), [])
 
     def get_world(self, name_short: str) -> Optional[World]:
-        for world in self.worlds:
-            if world.name_short == name_short:
-                return world
-        return None
+        return self._world_by_name.get(name_short)
 
     def draw_graph(self, action: Optional[str] = None) -> None:
         """
@@ -120,7 +173,10 @@ class Model:
 
         # 2. Layout
         plt.figure(figsize=(12, 10))
-        pos = nx.spring_layout(G, k=3.0, seed=42) 
+        layout_key = (frozenset(G.nodes), 42)
+        pos = _spring_layout_cache.get(layout_key)
+        if pos is None:
+            pos = _spring_layout_cache[layout_key] = nx.spring_layout(G, k=3.0, seed=42)
         
         NODE_SIZE = 2500
         
@@ -128,100 +184,111 @@ class Model:
         nx.draw_networkx_nodes(G, pos, node_size=NODE_SIZE, node_color=node_colors, edgecolors="black", linewidths=1.5)
         nx.draw_networkx_labels(G, pos, font_size=10, font_weight="bold")
 
-        # 3. Custom Edge Drawing Loop
-        for (u, v), text_list in edge_data.items():
-            full_text = "\n".join(text_list)
-            
-            is_bidirectional = (v, u) in edge_data and u != v
-            is_self_loop = (u == v)
-
-            if is_self_loop:
-                x, y = pos[u]
-
-                loop_size = 0.30  # controls visible loop height
-                dx = loop_size
-                dy = loop_size * 0.9  # slightly oval shape looks nicer
-
-                # smooth loop using a cubic Bezier curve
-                verts = [
-                    (x, y),               # start
-                    (x + dx, y + dy),     # control point 1
-                    (x - dx, y + dy),     # control point 2
-                    (x, y),               # end (back to node)
-                ]
-                codes = [Path.MOVETO, Path.CURVE4, Path.CURVE4, Path.CURVE4]
-
-                path = Path(verts, codes)
-                patch = PathPatch(
-                    path,
-                    edgecolor="#555555",
-                    linewidth=1.4,
-                    facecolor="none",
-                    zorder=1.5,
-                )
-                plt.gca().add_patch(patch)
-
-                # label close above the loop
-                label_y_offset = dy * 0.55
-                plt.text(
-                    x,
-                    y + label_y_offset,
-                    full_text,
-                    ha="center",
-                    va="center",
-                    fontsize=8,
-                    color="darkblue",
-                    zorder=3,
-                    bbox=dict(
-                        facecolor="white",
-                        edgecolor="lightgray",
-                        alpha=0.9,
-                        pad=0.25,
-                        boxstyle="round,pad=0.15",
-                    ),
-                )
-
-                continue
+        # 3. Edge Drawing
+        # Partition edges by style so each style is rendered with one
+        # networkx call instead of one call (and one FancyArrowPatch
+        # construction pass) per edge.
+        straight_edges = []
+        curved_edges = []
+        self_loops = []
+        for (u, v) in edge_data:
+            if u == v:
+                self_loops.append(u)
+            elif (v, u) in edge_data:
+                curved_edges.append((u, v))
+            else:
+                straight_edges.append((u, v))
 
+        rad = 0.2
+        if straight_edges:
+            nx.draw_networkx_edges(
+                G, pos, edgelist=straight_edges,
+                arrowstyle="-|>", arrowsize=25, edge_color="#555555", width=1.5,
+                node_size=NODE_SIZE
+            )
+        if curved_edges:
+            nx.draw_networkx_edges(
+                G, pos, edgelist=curved_edges,
+                connectionstyle=f"arc3,rad={rad}",
+                arrowstyle="-|>", arrowsize=25, edge_color="#555555", width=1.5,
+                node_size=NODE_SIZE
+            )
 
+        label_bbox = dict(facecolor='white', edgecolor='lightgray', alpha=0.9, pad=0.3, boxstyle='round,pad=0.2')
+
+        # Self-loops: build every Bezier patch first, add them as one collection.
+        loop_patches = []
+        for u in self_loops:
+            x, y = pos[u]
+
+            loop_size = 0.30  # controls visible loop height
+            dx = loop_size
+            dy = loop_size * 0.9  # slightly oval shape looks nicer
+
+            # smooth loop using a cubic Bezier curve
+            verts = [
+                (x, y),               # start
+                (x + dx, y + dy),     # control point 1
+                (x - dx, y + dy),     # control point 2
+                (x, y),               # end (back to node)
+            ]
+            codes = [Path.MOVETO, Path.CURVE4, Path.CURVE4, Path.CURVE4]
+
+            loop_patches.append(PathPatch(
+                Path(verts, codes),
+                edgecolor="#555555",
+                linewidth=1.4,
+                facecolor="none",
+                zorder=1.5,
+            ))
+
+            # label close above the loop
+            plt.text(
+                x,
+                y + dy * 0.55,
+                "\n".join(edge_data[(u, u)]),
+                ha="center",
+                va="center",
+                fontsize=8,
+                color="darkblue",
+                zorder=3,
+                bbox=dict(
+                    facecolor="white",
+                    edgecolor="lightgray",
+                    alpha=0.9,
+                    pad=0.25,
+                    boxstyle="round,pad=0.15",
+                ),
+            )
+        if loop_patches:
+            plt.gca().add_collection(PatchCollection(loop_patches, match_original=True))
+
+        # Labels for curved edges, offset off the arc's midpoint.
+        for (u, v) in curved_edges:
             x1, y1 = pos[u]
             x2, y2 = pos[v]
-            
-            if is_bidirectional:
-                rad = 0.2
-                # Draw Curved Edge
-                nx.draw_networkx_edges(
-                    G, pos, edgelist=[(u,v)], 
-                    connectionstyle=f"arc3,rad={rad}", 
-                    arrowstyle="-|>", arrowsize=25, edge_color="#555555", width=1.5,
-                    node_size=NODE_SIZE
-                )
-                
-                # Custom Label Placement Logic
-                mx, my = (x1 + x2) / 2, (y1 + y2) / 2
-                vx, vy = x2 - x1, y2 - y1
-                dist = math.sqrt(vx**2 + vy**2)
-                if dist == 0: dist = 1 
-                
-                nx_vec, ny_vec = vy/dist, -vx/dist
-                offset = rad * dist * 0.6 
-                lx = mx + nx_vec * offset
-                ly = my + ny_vec * offset
-                
-                plt.text(lx, ly, full_text, horizontalalignment='center', verticalalignment='center', fontsize=8, color='darkblue', 
-                         bbox=dict(facecolor='white', edgecolor='lightgray', alpha=0.9, pad=0.3, boxstyle='round,pad=0.2'))
+            mx, my = (x1 + x2) / 2, (y1 + y2) / 2
+            vx, vy = x2 - x1, y2 - y1
+            dist = math.sqrt(vx**2 + vy**2)
+            if dist == 0: dist = 1
 
-            else:
-                # Draw Straight Edge
-                nx.draw_networkx_edges(
-                    G, pos, edgelist=[(u,v)], 
-                    arrowstyle="-|>", arrowsize=25, edge_color="#555555", width=1.5,
-                    node_size=NODE_SIZE
-                )
-                # Standard center placement
-                mx, my = (x1 + x2) / 2, (y1 + y2) / 2
-                plt.text(mx, my, full_text, horizontalalignment='center', verticalalignment='center', fontsize=8, color='darkblue', 
-                         bbox=dict(facecolor='white', edgecolor='lightgray', alpha=0.9, pad=0.3, boxstyle='round,pad=0.2'))
+            nx_vec, ny_vec = vy/dist, -vx/dist
+            offset = rad * dist * 0.6
+            lx = mx + nx_vec * offset
+            ly = my + ny_vec * offset
+
+            plt.text(lx, ly, "\n".join(edge_data[(u, v)]),
+                     horizontalalignment='center', verticalalignment='center',
+                     fontsize=8, color='darkblue', bbox=label_bbox)
+
+        # Labels for straight edges, centered on the segment.
+        for (u, v) in straight_edges:
+            x1, y1 = pos[u]
+            x2, y2 = pos[v]
+            mx, my = (x1 + x2) / 2, (y1 + y2) / 2
+            plt.text(mx, my, "\n".join(edge_data[(u, v)]),
+                     horizontalalignment='center', verticalalignment='center',
+                     fontsize=8, color='darkblue', bbox=label_bbox)
 
         plt.title(title, fontsize=14, fontweight='bold')
         plt.axis("off")
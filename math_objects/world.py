@@ -18,6 +18,8 @@ class World:
         assignments (Dict[str, str]): Mapping of propositions to truth values (as strings).
     """
 
+    __slots__ = ("name_long", "name_short", "twist_structure", "assignments", "_parsed_assignments")
+
     def __init__(
         self, 
         name_long: str, 
@@ -38,6 +40,8 @@ class World:
         self.name_short = name_short
         self.twist_structure = twist_structure
         self.assignments = assignments if assignments is not None else {}
+        # Valuations parsed into (t, f) pairs on first use by the evaluator.
+        self._parsed_assignments: Dict[str, tuple] = {}
 
     def get_assignment(self, variable: str) -> Optional[str]:
         return self.assignments.get(variable)
@@ -47,6 +51,7 @@ class World:
         Assigns a value to a proposition.
         """
         self.assignments[variable] = value
+        self._parsed_assignments.pop(variable, None)
 
     def __repr__(self) -> str:
         return f"{self.name_short}"
\ No newline at end of file
@@ -15,251 +15,392 @@ Definitions & Abbreviations:
 - 0/BOT : Bottom (False) (0, 1)
 """
 
+import re
 from abc import ABC, abstractmethod
-from typing import Optional, Set, Any, Tuple
+from functools import lru_cache
+from typing import Optional, Set, Any, Tuple, Callable, Dict
 from ast import literal_eval
 
 # ==========================================
 #                 LEXER
 # ==========================================
 
+# Token kinds as small ints: parser dispatch compares integers instead of
+# strings, with _TOK_NAME kept only for error messages.
+(TOK_EOF, TOK_WS, TOK_BOX, TOK_DIAMOND, TOK_MAT_IFF, TOK_MAT_IMPLIES,
+ TOK_ATOM, TOK_NOT, TOK_AND, TOK_OR, TOK_LPAREN, TOK_RPAREN) = range(12)
+
+_TOK_NAME = {
+    TOK_EOF: 'EOF', TOK_WS: 'WS', TOK_BOX: 'BOX', TOK_DIAMOND: 'DIAMOND',
+    TOK_MAT_IFF: 'MAT_IFF', TOK_MAT_IMPLIES: 'MAT_IMPLIES', TOK_ATOM: 'ATOM',
+    TOK_NOT: 'NOT', TOK_AND: 'AND', TOK_OR: 'OR',
+    TOK_LPAREN: 'LPAREN', TOK_RPAREN: 'RPAREN',
+}
+
+_TOK_CODE = {name: code for code, name in _TOK_NAME.items()}
+
+# Master token pattern: one C-level regex match per token instead of a
+# Python-level loop per character. MAT_IFF must precede DIAMOND so that
+# '<->' is not read as a diamond over the action '-'.
+_TOKEN_RE = re.compile(
+    r"(?P<WS>\s+)"
+    r"|(?P<BOX>\[[A-Za-z0-9_]+\])"
+    r"|(?P<MAT_IFF><->)"
+    r"|(?P<DIAMOND><[A-Za-z0-9_]+>)"
+    r"|(?P<MAT_IMPLIES>->)"
+    r"|(?P<ATOM>[A-Za-z0-9_]+)"
+    r"|(?P<NOT>~)"
+    r"|(?P<AND>&)"
+    r"|(?P<OR>\|)"
+    r"|(?P<LPAREN>\()"
+    r"|(?P<RPAREN>\))"
+)
+
+# Bare identifier, used only to pinpoint the failure inside a malformed
+# modal operator when the master pattern does not match.
+_IDENT_RE = re.compile(r"[A-Za-z0-9_]+")
+
+
 class Lexer:
+    __slots__ = ('text', 'pos')
+
     def __init__(self, text: str):
         self.text = text
         self.pos = 0
-        self.current_char: Optional[str] = self.text[0] if self.text else None
-
-    def advance(self) -> None:
-        self.pos += 1
-        self.current_char = self.text[self.pos] if self.pos < len(self.text) else None
-
-    def skip_whitespace(self) -> None:
-        while self.current_char is not None and self.current_char.isspace():
-            self.advance()
-
-    def get_identifier(self) -> str:
-        result = ''
-        while self.current_char is not None and (self.current_char.isalnum() or self.current_char == '_'):
-            result += self.current_char
-            self.advance()
-        return result
-
-    def get_next_token(self) -> Tuple[str, Optional[str], int]:
-        """Returns (Token Type, Token Value, Start Position)"""
-        while self.current_char is not None:
-            if self.current_char.isspace():
-                self.skip_whitespace()
+
+    def get_next_token(self) -> Tuple[int, Optional[str], int]:
+        """Returns (Token Kind, Token Value, Start Position)"""
+        text = self.text
+        pos = self.pos
+        n = len(text)
+        while pos < n:
+            match = _TOKEN_RE.match(text, pos)
+            if match is None:
+                self.pos = pos
+                self._raise_lex_error(pos)
+            kind = _TOK_CODE[match.lastgroup]
+            pos = match.end()
+            if kind == TOK_WS:
                 continue
-            
-            # Track start position for error reporting
-            start_pos = self.pos
-
-            # Modal Box [a]
-            if self.current_char == '[':
-                self.advance()
-                if self.current_char == ']':
-                    raise ValueError(f"Error at index {start_pos}: Box operator '[]' requires an action identifier.")
-                action = self.get_identifier()
-                if not action:
-                    raise ValueError(f"Error at index {start_pos}: Invalid action identifier inside Box operator.")
-                if self.current_char == ']':
-                    self.advance()
-                    return ('BOX', action, start_pos)
-                raise ValueError(f"Error at index {self.pos}: Expected ']' after action.")
-
-            # Modal Diamond <a>
-            if self.current_char == '<':
-                self.advance()
-                
-                # Check for Material IFF <->
-                if self.current_char == '-':
-                    self.advance()
-                    if self.current_char == '>':
-                        self.advance()
-                        return ('MAT_IFF', '<->', start_pos)
-                    raise ValueError(f"Error at index {start_pos}: Expected '>' after '<-'.")
-
-                # Modal Diamond <> check
-                if self.current_char == '>':
-                    raise ValueError(f"Error at index {start_pos}: Diamond operator '<>' requires an action identifier.")
-
-                action = self.get_identifier()
-                if not action:
-                     raise ValueError(f"Error at index {start_pos}: Invalid action identifier inside Diamond operator.")
-
-                if self.current_char == '>':
-                    self.advance()
-                    return ('DIAMOND', action, start_pos)
-                raise ValueError(f"Error at index {self.pos}: Expected '>' after action.")
-            
-            # Atoms (and TOP and BOT)
-            if self.current_char.isalnum():
-                val = self.get_identifier()
+            self.pos = pos
+            start_pos = match.start()
+
+            if kind == TOK_ATOM:
+                val = match.group()
                 if val == '1' or val.upper() == 'TOP':
-                    return ('ATOM', 'TOP', start_pos)
+                    return (TOK_ATOM, 'TOP', start_pos)
                 if val == '0' or val.upper() == 'BOT':
-                    return ('ATOM', 'BOT', start_pos)
-                return ('ATOM', val, start_pos)
-            
-            if self.current_char == '1': 
-                self.advance()
-                return ('ATOM', 'TOP', start_pos)
-            if self.current_char == '0':
-                self.advance()
-                return ('ATOM', 'BOT', start_pos)
-
-            # Connectives
-            char_map = {
-                '~': ('NOT', '~'),
-                '&': ('AND', '&'), 
-                '|': ('OR', '|'),  
-                '(': ('LPAREN', '('),
-                ')': ('RPAREN', ')')
-            }
-
-            if self.current_char in char_map:
-                token = char_map[self.current_char]
-                self.advance()
-                return (token[0], token[1], start_pos)
-            
-            # Material Implication ->
-            if self.current_char == '-':
-                self.advance()
-                if self.current_char == '>':
-                    self.advance()
-                    return ('MAT_IMPLIES', '->', start_pos)
-                raise ValueError(f"Error at index {start_pos}: Expected '>' after '-'.")
-            
-            raise ValueError(f"Unknown character at index {start_pos}: {self.current_char}")
-        
-        return ('EOF', None, self.pos)
+                    return (TOK_ATOM, 'BOT', start_pos)
+                return (TOK_ATOM, val, start_pos)
+
+            if kind == TOK_BOX or kind == TOK_DIAMOND:
+                # Strip the enclosing brackets to expose the action name.
+                return (kind, match.group()[1:-1], start_pos)
+
+            return (kind, match.group(), start_pos)
+
+        self.pos = pos
+        return (TOK_EOF, None, pos)
+
+    def _raise_lex_error(self, pos: int) -> None:
+        """Diagnoses why the master pattern failed at `pos` and raises."""
+        text = self.text
+        char = text[pos]
+
+        if char == '[':
+            if text.startswith(']', pos + 1):
+                raise ValueError(f"Error at index {pos}: Box operator '[]' requires an action identifier.")
+            action = _IDENT_RE.match(text, pos + 1)
+            if action is None:
+                raise ValueError(f"Error at index {pos}: Invalid action identifier inside Box operator.")
+            raise ValueError(f"Error at index {action.end()}: Expected ']' after action.")
+
+        if char == '<':
+            if text.startswith('-', pos + 1):
+                raise ValueError(f"Error at index {pos}: Expected '>' after '<-'.")
+            if text.startswith('>', pos + 1):
+                raise ValueError(f"Error at index {pos}: Diamond operator '<>' requires an action identifier.")
+            action = _IDENT_RE.match(text, pos + 1)
+            if action is None:
+                raise ValueError(f"Error at index {pos}: Invalid action identifier inside Diamond operator.")
+            raise ValueError(f"Error at index {action.end()}: Expected '>' after action.")
+
+        if char == '-':
+            raise ValueError(f"Error at index {pos}: Expected '>' after '-'.")
+
+        raise ValueError(f"Unknown character at index {pos}: {char}")
+
+
+def _parse_pair(s: str) -> Optional[Tuple[str, str]]:
+    """
+    Fast path for valuation strings of the exact shape "('t', 'f')" — the
+    form the savers emit — without the full ast round-trip literal_eval
+    pays. Returns None for anything else so the caller can fall back.
+    """
+    inner = s.strip()
+    if not (inner.startswith('(') and inner.endswith(')')):
+        return None
+    a, sep, b = inner[1:-1].partition(',')
+    if not sep or ',' in b:
+        return None
+    a = a.strip()
+    b = b.strip()
+    if (len(a) >= 2 and a[0] == a[-1] and a[0] in '\'"'
+            and len(b) >= 2 and b[0] == b[-1] and b[0] in '\'"'):
+        return (a[1:-1], b[1:-1])
+    return None
 
 
 # ==========================================
 #               AST NODES
 # ==========================================
 
+# Per-invocation (node, world) -> value cache, active only inside
+# model_check. With hash-consed parsing, duplicated subformulas are the
+# same node object, so a hit skips their whole subtree.
+_EVAL_CACHE: Optional[Dict[Tuple[int, int], Tuple[str, str]]] = None
+
+
 class ASTNode(ABC):
+    # _atoms backs the lazy get_atoms cache on every subclass.
+    __slots__ = ('_atoms',)
+
     @abstractmethod
-    def evaluate(self, model: Any, world: Any, twist: Any) -> Tuple[str, str]:
+    def _evaluate(self, model: Any, world: Any, twist: Any) -> Tuple[str, str]:
         pass
 
     @abstractmethod
-    def get_atoms(self) -> Set[str]:
+    def _compute_atoms(self) -> Set[str]:
         pass
 
+    def evaluate(self, model: Any, world: Any, twist: Any) -> Tuple[str, str]:
+        cache = _EVAL_CACHE
+        if cache is None:
+            return self._evaluate(model, world, twist)
+        key = (id(self), id(world))
+        hit = cache.get(key)
+        if hit is None:
+            hit = cache[key] = self._evaluate(model, world, twist)
+        return hit
+
+    def get_atoms(self) -> Set[str]:
+        """Atoms occurring in the subtree, computed once and cached."""
+        atoms = getattr(self, '_atoms', None)
+        if atoms is None:
+            atoms = self._atoms = frozenset(self._compute_atoms())
+        return atoms
+
+    def compile(self) -> Callable[[Any, Any, Any], Tuple[str, str]]:
+        """
+        Builds a closure tree evaluating this subtree. The returned function
+        takes (model, world, twist) and skips the per-node virtual dispatch
+        of evaluate(), which matters when a formula runs once per world.
+        """
+        return self.evaluate
+
+    @staticmethod
+    def _modal_fold(model: Any, world: Any, twist: Any, action: str,
+                    child_eval: Callable[[Any, Any, Any], Tuple[str, str]]) -> Tuple[str, str]:
+        """
+        Join-fold of residues over the action's successors — the common
+        core of Diamond and (via De Morgan) Box. Stops early once the
+        accumulator reaches the absorbing (top, bottom).
+        """
+        acc = twist._bot_pair
+        top_pair = twist._top_pair
+        weak_join = twist.weak_join
+        residue_meet = twist.residue_meet
+        for target, rel_weight in model.successors(action, world):
+            acc = weak_join(acc, residue_meet(rel_weight, child_eval(model, target, twist)))
+            if acc == top_pair:
+                break
+        return acc
+
 
 class Atom(ASTNode):
+    __slots__ = ('name',)
+
     def __init__(self, name: str):
         self.name = name
 
-    def get_atoms(self) -> Set[str]:
+    def _compute_atoms(self) -> Set[str]:
         if self.name in ['TOP', 'BOT', '1', '0']:
             return set()
         return {self.name}
 
-    def evaluate(self, model: Any, world: Any, twist: Any) -> Tuple[str, str]:
+    def _evaluate(self, model: Any, world: Any, twist: Any) -> Tuple[str, str]:
         # TOP/BOT Definitions
         if self.name == 'BOT' or self.name == '0':
-            return (twist.residuated_lattice.bottom, twist.residuated_lattice.top)
-        
+            return twist._bot_pair
+
         if self.name == 'TOP' or self.name == '1':
-            return (twist.residuated_lattice.top, twist.residuated_lattice.bottom)
-            
+            return twist._top_pair
+
+        # Parsed valuations are cached per world, so literal_eval runs at
+        # most once per (world, atom) no matter how often modal recursion
+        # revisits the same state.
+        cached = world._parsed_assignments.get(self.name)
+        if cached is not None:
+            return cached
+
         if self.name in world.assignments:
             val_str = world.assignments[self.name]
             try:
-                if val_str.strip().startswith('('): 
-                    val = literal_eval(val_str)
-                    if not isinstance(val, tuple) or len(val) != 2:
-                        raise ValueError(f"Atom '{self.name}' has invalid value {val}. Expected a pair (t, f).")
-                    return val
-                return (val_str, val_str)
+                if val_str.strip().startswith('('):
+                    val = _parse_pair(val_str)
+                    if val is None:
+                        val = literal_eval(val_str)
+                        if not isinstance(val, tuple) or len(val) != 2:
+                            raise ValueError(f"Atom '{self.name}' has invalid value {val}. Expected a pair (t, f).")
+                else:
+                    val = (val_str, val_str)
             except Exception:
-                return (val_str, val_str)
-                
+                val = (val_str, val_str)
+            world._parsed_assignments[self.name] = val
+            return val
+
         raise ValueError(f"Undefined Atom: '{self.name}' is not assigned in state '{world.name_short}'.")
 
 
 class Not(ASTNode):
+    __slots__ = ('child',)
+
     def __init__(self, child: ASTNode):
         self.child = child
-    def get_atoms(self) -> Set[str]: return self.child.get_atoms()
+    def _compute_atoms(self) -> Set[str]: return self.child.get_atoms()
     # Negation Semantics
-    def evaluate(self, model: Any, world: Any, twist: Any) -> Tuple[str, str]:
+    def _evaluate(self, model: Any, world: Any, twist: Any) -> Tuple[str, str]:
         return twist.negation(self.child.evaluate(model, world, twist))
 
+    def compile(self) -> Callable[[Any, Any, Any], Tuple[str, str]]:
+        cf = self.child.compile()
+        return lambda m, w, t: t.negation(cf(m, w, t))
+
+
+class And(ASTNode):
+    __slots__ = ('left', 'right')
 
-class And(ASTNode): 
     def __init__(self, left: ASTNode, right: ASTNode):
         self.left, self.right = left, right
-    def get_atoms(self) -> Set[str]: return self.left.get_atoms().union(self.right.get_atoms())
+    def _compute_atoms(self) -> Set[str]: return self.left.get_atoms().union(self.right.get_atoms())
     # Conjunction Semantics (Weak Meet)
-    def evaluate(self, model: Any, world: Any, twist: Any) -> Tuple[str, str]:
-        return twist.weak_meet(self.left.evaluate(model, world, twist), self.right.evaluate(model, world, twist))
+    def _evaluate(self, model: Any, world: Any, twist: Any) -> Tuple[str, str]:
+        # (bottom, top) absorbs the weak meet: skip the right subtree.
+        val_l = self.left.evaluate(model, world, twist)
+        if val_l == twist._bot_pair:
+            return val_l
+        return twist.weak_meet(val_l, self.right.evaluate(model, world, twist))
+
+    def compile(self) -> Callable[[Any, Any, Any], Tuple[str, str]]:
+        lf, rf = self.left.compile(), self.right.compile()
+
+        def run(m, w, t):
+            val_l = lf(m, w, t)
+            if val_l == t._bot_pair:
+                return val_l
+            return t.weak_meet(val_l, rf(m, w, t))
+        return run
 
 
 class Or(ASTNode):
+    __slots__ = ('left', 'right')
+
     def __init__(self, left: ASTNode, right: ASTNode):
         self.left, self.right = left, right
-    def get_atoms(self) -> Set[str]: return self.left.get_atoms().union(self.right.get_atoms())
+    def _compute_atoms(self) -> Set[str]: return self.left.get_atoms().union(self.right.get_atoms())
     # Disjunction Semantics (Weak Join)
-    def evaluate(self, model: Any, world: Any, twist: Any) -> Tuple[str, str]:
-        return twist.weak_join(self.left.evaluate(model, world, twist), self.right.evaluate(model, world, twist))
+    def _evaluate(self, model: Any, world: Any, twist: Any) -> Tuple[str, str]:
+        # (top, bottom) absorbs the weak join: skip the right subtree.
+        val_l = self.left.evaluate(model, world, twist)
+        if val_l == twist._top_pair:
+            return val_l
+        return twist.weak_join(val_l, self.right.evaluate(model, world, twist))
+
+    def compile(self) -> Callable[[Any, Any, Any], Tuple[str, str]]:
+        lf, rf = self.left.compile(), self.right.compile()
+
+        def run(m, w, t):
+            val_l = lf(m, w, t)
+            if val_l == t._top_pair:
+                return val_l
+            return t.weak_join(val_l, rf(m, w, t))
+        return run
 
 
 class MaterialImplies(ASTNode):
+    __slots__ = ('left', 'right')
+
     def __init__(self, left: ASTNode, right: ASTNode):
         self.left, self.right = left, right
-    def get_atoms(self) -> Set[str]: return self.left.get_atoms().union(self.right.get_atoms())
+    def _compute_atoms(self) -> Set[str]: return self.left.get_atoms().union(self.right.get_atoms())
     # Material Implication Semantics (~A | B)
-    def evaluate(self, model: Any, world: Any, twist: Any) -> Tuple[str, str]:
+    def _evaluate(self, model: Any, world: Any, twist: Any) -> Tuple[str, str]:
         val_l = self.left.evaluate(model, world, twist)
         not_l = twist.negation(val_l)
         val_r = self.right.evaluate(model, world, twist)
         return twist.weak_join(not_l, val_r)
 
+    def compile(self) -> Callable[[Any, Any, Any], Tuple[str, str]]:
+        lf, rf = self.left.compile(), self.right.compile()
+        return lambda m, w, t: t.weak_join(t.negation(lf(m, w, t)), rf(m, w, t))
+
 
 class MaterialIff(ASTNode):
+    __slots__ = ('left', 'right')
+
     def __init__(self, left: ASTNode, right: ASTNode):
         self.left, self.right = left, right
-    def get_atoms(self) -> Set[str]: return self.left.get_atoms().union(self.right.get_atoms())
+    def _compute_atoms(self) -> Set[str]: return self.left.get_atoms().union(self.right.get_atoms())
     # Material Equivalence Semantics ((A->B) & (B->A))
-    def evaluate(self, model: Any, world: Any, twist: Any) -> Tuple[str, str]:
+    def _evaluate(self, model: Any, world: Any, twist: Any) -> Tuple[str, str]:
         val_l = self.left.evaluate(model, world, twist)
         val_r = self.right.evaluate(model, world, twist)
-        
-        not_l = twist.negation(val_l)
-        not_r = twist.negation(val_r)
-        
-        imp_lr = twist.weak_join(not_l, val_r)
-        imp_rl = twist.weak_join(not_r, val_l)
-        
-        return twist.weak_meet(imp_lr, imp_rl)
+        return twist.biconditional(val_l, val_r)
+
+    def compile(self) -> Callable[[Any, Any, Any], Tuple[str, str]]:
+        lf, rf = self.left.compile(), self.right.compile()
+        return lambda m, w, t: t.biconditional(lf(m, w, t), rf(m, w, t))
 
 
 class Diamond(ASTNode):
     """
     Modal Diamond: <a>phi
     """
+
+    __slots__ = ('child', 'action', '_checked_model')
+
     def __init__(self, child: ASTNode, action: str):
         self.child, self.action = child, action
+        # Last model this node's action was validated against.
+        self._checked_model: Any = None
 
-    def get_atoms(self) -> Set[str]: return self.child.get_atoms()
+    def _compute_atoms(self) -> Set[str]: return self.child.get_atoms()
 
     # Diamond Semantics
-    def evaluate(self, model: Any, world: Any, twist: Any) -> Tuple[str, str]:
-        if self.action not in model.actions:
-            raise ValueError(f"Action '{self.action}' is not defined in PLTS '{model.name_model}'.")
-        
-        targets_map = model.accessibility_relations.get(self.action, {}).get(world, {})
-        results = []
-        for target, rel_weight in targets_map.items():
-            val_succ = self.child.evaluate(model, target, twist)
-            residue_val = twist.residue_meet(rel_weight, val_succ)
-            results.append(residue_val)
-
-        return twist.weak_join_set(results)
+    def _evaluate(self, model: Any, world: Any, twist: Any) -> Tuple[str, str]:
+        if model is not self._checked_model:
+            if self.action not in model.actions:
+                raise ValueError(f"Action '{self.action}' is not defined in PLTS '{model.name_model}'.")
+            self._checked_model = model
+
+        # Fold the join over successors directly instead of materializing
+        # the residue list; once the accumulator reaches (top, bottom) no
+        # further successor can change it.
+        return self._modal_fold(model, world, twist, self.action, self.child.evaluate)
+
+    def compile(self) -> Callable[[Any, Any, Any], Tuple[str, str]]:
+        cf, action, fold = self.child.compile(), self.action, ASTNode._modal_fold
+        checked_model = None
+
+        def run(m, w, t):
+            # Validate the action once per model, not once per world.
+            nonlocal checked_model
+            if m is not checked_model:
+                if action not in m.actions:
+                    raise ValueError(f"Action '{action}' is not defined in PLTS '{m.name_model}'.")
+                checked_model = m
+            return fold(m, w, t, action, cf)
+        return run
 
 
 class Box(ASTNode):
@@ -267,16 +408,31 @@ class Box(ASTNode):
     Modal Box: [action]A
     Derived from Diamond: ~<action>~A
     """
+
+    __slots__ = ('child', 'action', '_checked_model')
+
     def __init__(self, child: ASTNode, action: str):
         self.child, self.action = child, action
+        self._checked_model: Any = None
 
-    def get_atoms(self) -> Set[str]: return self.child.get_atoms()
+    def _compute_atoms(self) -> Set[str]: return self.child.get_atoms()
 
     # Box Semantics
-    def evaluate(self, model: Any, world: Any, twist: Any) -> Tuple[str, str]:
-        not_phi = Not(self.child)
-        diamond = Diamond(not_phi, self.action)
-        return twist.negation(diamond.evaluate(model, world, twist))
+    def _evaluate(self, model: Any, world: Any, twist: Any) -> Tuple[str, str]:
+        # ~<a>~A inlined: no transient Not/Diamond nodes per evaluation.
+        if model is not self._checked_model:
+            if self.action not in model.actions:
+                raise ValueError(f"Action '{self.action}' is not defined in PLTS '{model.name_model}'.")
+            self._checked_model = model
+
+        acc = self._modal_fold(model, world, twist, self.action, self._neg_child_eval)
+        return twist.negation(acc)
+
+    def _neg_child_eval(self, model: Any, world: Any, twist: Any) -> Tuple[str, str]:
+        return twist.negation(self.child.evaluate(model, world, twist))
+
+    def compile(self) -> Callable[[Any, Any, Any], Tuple[str, str]]:
+        return Not(Diamond(Not(self.child), self.action)).compile()
 
 
 # ==========================================
@@ -284,54 +440,70 @@ class Box(ASTNode):
 # ==========================================
 
 class FormulaParser:
+    __slots__ = ('lexer', 'current_token', '_nodes')
+
     def __init__(self, text: str):
         self.lexer = Lexer(text)
         self.current_token = self.lexer.get_next_token()
+        # Hash-consing table: structurally identical subtrees built during
+        # this parse collapse to one shared node.
+        self._nodes: Dict[tuple, ASTNode] = {}
+
+    def _make(self, cls, *args) -> ASTNode:
+        # Children are consed bottom-up, so identity stands in for structure.
+        key = (cls, *(id(a) if isinstance(a, ASTNode) else a for a in args))
+        node = self._nodes.get(key)
+        if node is None:
+            node = self._nodes[key] = cls(*args)
+        return node
 
-    def eat(self, token_type: str) -> None:
+    def eat(self, token_type: int) -> None:
         if self.current_token[0] == token_type:
             self.current_token = self.lexer.get_next_token()
         else:
             pos = self.current_token[2]
-            raise ValueError(f"Syntax Error at index {pos}: Expected {token_type}, got {self.current_token[0]}")
+            raise ValueError(
+                f"Syntax Error at index {pos}: Expected {_TOK_NAME[token_type]}, "
+                f"got {_TOK_NAME[self.current_token[0]]}"
+            )
 
     def parse(self) -> ASTNode:
         res = self.iff()
-        if self.current_token[0] != 'EOF': 
+        if self.current_token[0] != TOK_EOF: 
             pos = self.current_token[2]
             raise ValueError(f"Syntax Error at index {pos}: Unexpected characters at end of formula.")
         return res
 
     def iff(self) -> ASTNode:
         node = self.implies()
-        while self.current_token[0] == 'MAT_IFF':
-            self.eat('MAT_IFF')
+        while self.current_token[0] == TOK_MAT_IFF:
+            self.eat(TOK_MAT_IFF)
             right = self.implies()
-            node = MaterialIff(node, right)
+            node = self._make(MaterialIff, node, right)
         return node
 
     def implies(self) -> ASTNode:
         node = self.expr_sum()
-        while self.current_token[0] == 'MAT_IMPLIES':
-            self.eat('MAT_IMPLIES')
+        while self.current_token[0] == TOK_MAT_IMPLIES:
+            self.eat(TOK_MAT_IMPLIES)
             right = self.expr_sum()
-            node = MaterialImplies(node, right)
+            node = self._make(MaterialImplies, node, right)
         return node
 
     def expr_sum(self) -> ASTNode:
         # Handle OR
         node = self.expr_prod()
-        while self.current_token[0] == 'OR':
-            self.eat('OR')
-            node = Or(node, self.expr_prod())
+        while self.current_token[0] == TOK_OR:
+            self.eat(TOK_OR)
+            node = self._make(Or, node, self.expr_prod())
         return node
 
     def expr_prod(self) -> ASTNode: 
         # Handle AND
         node = self.unary()
-        while self.current_token[0] == 'AND':
-            self.eat('AND')
-            node = And(node, self.unary())
+        while self.current_token[0] == TOK_AND:
+            self.eat(TOK_AND)
+            node = self._make(And, node, self.unary())
         return node
 
     def unary(self) -> ASTNode:
@@ -339,24 +511,53 @@ class FormulaParser:
         val = self.current_token[1]
         start_pos = self.current_token[2]
 
-        if token == 'NOT':
-            self.eat('NOT')
-            return Not(self.unary())
-        elif token == 'BOX':
-            self.eat('BOX')
-            return Box(self.unary(), val)
-        elif token == 'DIAMOND':
-            self.eat('DIAMOND')
-            return Diamond(self.unary(), val)
-        elif token == 'LPAREN':
-            self.eat('LPAREN')
+        if token == TOK_NOT:
+            self.eat(TOK_NOT)
+            return self._make(Not, self.unary())
+        elif token == TOK_BOX:
+            self.eat(TOK_BOX)
+            return self._make(Box, self.unary(), val)
+        elif token == TOK_DIAMOND:
+            self.eat(TOK_DIAMOND)
+            return self._make(Diamond, self.unary(), val)
+        elif token == TOK_LPAREN:
+            self.eat(TOK_LPAREN)
             node = self.iff()
-            self.eat('RPAREN')
+            self.eat(TOK_RPAREN)
             return node
-        elif token == 'ATOM':
-            self.eat('ATOM')
-            return Atom(val)
-        elif token == 'EOF':
+        elif token == TOK_ATOM:
+            self.eat(TOK_ATOM)
+            return self._make(Atom, val)
+        elif token == TOK_EOF:
             raise ValueError("Unexpected end of formula. Did you forget a closing parenthesis or an atom?")
         else:
-            raise ValueError(f"Syntax Error at index {start_pos}: Unexpected token: {token}")
\ No newline at end of file
+            raise ValueError(f"Syntax Error at index {start_pos}: Unexpected token: {_TOK_NAME[token]}")
+
+
+@lru_cache(maxsize=256)
+def parse_formula(text: str) -> ASTNode:
+    """Parses a formula into an AST, memoized on the formula text."""
+    return FormulaParser(text).parse()
+
+
+@lru_cache(maxsize=256)
+def compile_formula(text: str) -> Callable[[Any, Any, Any], Tuple[str, str]]:
+    """Parses and compiles a formula into a closure evaluator, memoized on the text."""
+    return parse_formula(text).compile()
+
+
+def model_check(text: str, model: Any, twist: Any = None) -> Dict[Any, Tuple[str, str]]:
+    """
+    Evaluates a formula in every world of the model. Runs with a
+    per-invocation (node, world) cache, so subformulas the parser
+    hash-consed into shared nodes are computed once per world.
+    """
+    global _EVAL_CACHE
+    root = parse_formula(text)
+    if twist is None:
+        twist = model.twist_structure
+    _EVAL_CACHE = {}
+    try:
+        return {world: root.evaluate(model, world, twist) for world in model.worlds}
+    finally:
+        _EVAL_CACHE = None